@@ -8,6 +8,13 @@ from ..core.exceptions import ConfigurationError
 from ..core.models import AgentInfo, ProxyConfig, ProxyRole
 from .models import AgentRegistryConfig, ProxyConfigModel
 
+# Prefer libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Compiled validators, looked up once instead of on every load
+_PROXY_CONFIG_VALIDATOR = ProxyConfigModel.__pydantic_validator__
+_AGENT_REGISTRY_VALIDATOR = AgentRegistryConfig.__pydantic_validator__
+
 
 class ConfigLoader:
     """Load and parse configuration files."""
@@ -25,9 +32,9 @@ class ConfigLoader:
 
         try:
             with open(config_path) as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YAML_LOADER)
 
-            model = ProxyConfigModel(**data)
+            model: ProxyConfigModel = _PROXY_CONFIG_VALIDATOR.validate_python(data)
 
             return ProxyConfig(
                 id=model.proxy["id"],
@@ -55,9 +62,9 @@ class ConfigLoader:
 
         try:
             with open(registry_path) as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YAML_LOADER)
 
-            model = AgentRegistryConfig(**data)
+            model: AgentRegistryConfig = _AGENT_REGISTRY_VALIDATOR.validate_python(data)
 
             agents = {}
             for group_name, group_config in model.groups.items():
@@ -94,7 +101,9 @@ class ConfigLoader:
 
         try:
             # Parse the agent registry using the AgentRegistryConfig model
-            registry_model = AgentRegistryConfig(**config.agent_registry)
+            registry_model: AgentRegistryConfig = _AGENT_REGISTRY_VALIDATOR.validate_python(
+                config.agent_registry
+            )
 
             # Extract agents from all groups
             for group_name, group_config in registry_model.groups.items():
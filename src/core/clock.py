@@ -0,0 +1,8 @@
+"""Wall-clock access for the A2A Service Bus Proxy."""
+
+from datetime import datetime
+
+
+def utcnow() -> datetime:
+    """Current UTC time; the single seam tests replace with a fake clock."""
+    return datetime.utcnow()
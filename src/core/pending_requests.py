@@ -8,6 +8,8 @@ from typing import Any
 
 import structlog
 
+from . import clock
+
 logger = structlog.get_logger(__name__)
 
 
@@ -24,7 +26,8 @@ class PendingRequest:
     def __post_init__(self) -> None:
         """Initialize the future for waiting."""
         if self.future is None:
-            self.future = asyncio.Future()
+            # Let the running loop build the future so uvloop can use its native implementation
+            self.future = asyncio.get_running_loop().create_future()
 
     @property
     def is_expired(self) -> bool:
@@ -32,7 +35,7 @@ class PendingRequest:
         if self.is_completed:
             return False
         timeout_delta = timedelta(seconds=self.timeout_seconds)
-        return datetime.utcnow() > (self.created_at + timeout_delta)
+        return clock.utcnow() > (self.created_at + timeout_delta)
 
     def complete_with_response(self, response: Any) -> None:
         """Complete the request with a response."""
@@ -127,7 +130,7 @@ class PendingRequestManager:
         metadata = metadata or {}
         request = PendingRequest(
             correlation_id=correlation_id,
-            created_at=datetime.utcnow(),
+            created_at=clock.utcnow(),
             timeout_seconds=timeout_seconds,
             metadata=metadata
         )
@@ -229,7 +232,7 @@ class PendingRequestManager:
 
     async def _cleanup_expired_requests(self) -> None:
         """Clean up expired pending requests."""
-        current_time = datetime.utcnow()
+        current_time = clock.utcnow()
         expired_requests = []
         
         for correlation_id, request in self._pending_requests.items():
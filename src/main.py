@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any, cast
 
 import structlog
+from azure.core.pipeline.transport import RequestsTransport
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse
 
@@ -22,6 +23,7 @@ from .routing.router import MessageRouter
 from .servicebus import MessagePublisher, MessageSubscriber
 from .servicebus.client import AzureServiceBusClient
 from .servicebus.models import ServiceBusConfig
+from .servicebus.topic_manager import close_shared_transport, create_shared_transport
 from .sessions.manager import SessionManager
 from .sessions.models import SessionConfig
 
@@ -66,6 +68,7 @@ message_publisher: MessagePublisher | None = None
 message_subscriber: MessageSubscriber | None = None
 message_router: MessageRouter | None = None
 pending_request_manager: PendingRequestManager | None = None
+admin_transport: RequestsTransport | None = None
 
 
 def get_config_file_path() -> tuple[str, str]:
@@ -105,6 +108,7 @@ def get_config_file_path() -> tuple[str, str]:
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     """Application lifespan manager."""
     global config, agent_registry, session_manager, servicebus_client, message_publisher, message_subscriber, message_router
+    global admin_transport
 
     print("[DEBUG] Lifespan function started")  # Debug print to ensure function is called
 
@@ -176,6 +180,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
                 message_subscriber = MessageSubscriber(servicebus_client, sb_config, config.id)
                 logger.info("Service Bus publisher and subscriber initialized")
 
+                # One connection pool for every topic manager's admin client, closed on shutdown
+                if config.role == ProxyRole.COORDINATOR:
+                    admin_transport = create_shared_transport()
+
                 # Initialize topic management for coordinator proxies
                 if config.role == ProxyRole.COORDINATOR and config.agent_groups:
                     logger.info(f"Initializing topic management for {len(config.agent_groups)} agent groups")
@@ -184,7 +192,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
 
                         topic_manager = TopicManager(
                             namespace=config.servicebus.namespace,
-                            connection_string=config.servicebus.connection_string
+                            connection_string=config.servicebus.connection_string,
+                            transport=admin_transport
                         )
 
                         async with topic_manager:
@@ -297,6 +306,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
             except Exception as e:
                 logger.error("Error stopping Service Bus client", error=str(e))
 
+        # Close the topic managers' shared connection pool
+        if admin_transport:
+            close_shared_transport(admin_transport)
+            admin_transport = None
+
         # Stop pending request manager
         if pending_request_manager:
             await pending_request_manager.stop()
@@ -354,6 +368,11 @@ async def get_message_router() -> MessageRouter | None:
     return message_router
 
 
+async def get_admin_transport() -> RequestsTransport | None:
+    """Get the HTTP transport shared by topic manager admin clients."""
+    return admin_transport
+
+
 # Exception handlers
 @app.exception_handler(A2AProxyError)
 async def a2a_proxy_error_handler(request: Request, exc: A2AProxyError) -> JSONResponse:
@@ -646,7 +665,8 @@ async def list_managed_topics() -> dict[str, Any]:
     from .servicebus.topic_manager import TopicManager
     topic_manager = TopicManager(
         namespace=proxy_config.servicebus.namespace,
-        connection_string=proxy_config.servicebus.connection_string
+        connection_string=proxy_config.servicebus.connection_string,
+        transport=await get_admin_transport()
     )
 
     try:
@@ -676,7 +696,8 @@ async def validate_topic_health(group_name: str) -> dict[str, Any]:
     from .servicebus.topic_manager import TopicManager
     topic_manager = TopicManager(
         namespace=proxy_config.servicebus.namespace,
-        connection_string=proxy_config.servicebus.connection_string
+        connection_string=proxy_config.servicebus.connection_string,
+        transport=await get_admin_transport()
     )
 
     try:
@@ -718,7 +739,8 @@ async def recreate_topic_set(group_name: str) -> dict[str, Any]:
     from .servicebus.topic_manager import TopicManager
     topic_manager = TopicManager(
         namespace=proxy_config.servicebus.namespace,
-        connection_string=proxy_config.servicebus.connection_string
+        connection_string=proxy_config.servicebus.connection_string,
+        transport=await get_admin_transport()
     )
 
     try:
@@ -3,7 +3,7 @@
 import asyncio
 import json
 import logging
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any, Optional
 
 from azure.core.exceptions import AzureError
@@ -422,7 +422,7 @@ class AzureServiceBusClient(IServiceBusClient):
                 envelope=envelope,
                 payload=payload.encode('utf-8') if isinstance(payload, str) else payload,
                 message_type=message_type,
-                created_at=datetime.utcnow(),
+                created_at=datetime.now(UTC),
                 properties=dict(azure_message.application_properties)
             )
 
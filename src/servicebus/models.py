@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
@@ -29,7 +29,7 @@ class ServiceBusMessage:
     envelope: MessageEnvelope
     payload: bytes
     message_type: ServiceBusMessageType
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     expires_at: datetime | None = None
     retry_count: int = 0
     properties: dict[str, Any] = field(default_factory=dict)
@@ -38,7 +38,11 @@ class ServiceBusMessage:
         """Check if message has expired."""
         if self.expires_at is None:
             return False
-        return datetime.utcnow() > self.expires_at
+        expires_at = self.expires_at
+        if expires_at.tzinfo is None:
+            # Naive deadlines are UTC
+            expires_at = expires_at.replace(tzinfo=UTC)
+        return datetime.now(UTC) > expires_at
 
     def add_retry(self) -> None:
         """Increment retry count."""
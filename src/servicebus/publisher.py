@@ -1,7 +1,7 @@
 """Message publisher implementation for Service Bus."""
 
 import logging
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 from src.core.models import MessageEnvelope
@@ -45,7 +45,7 @@ class MessagePublisher(IMessagePublisher):
                 envelope=envelope,
                 payload=payload,
                 message_type=ServiceBusMessageType.REQUEST,
-                created_at=datetime.utcnow()
+                created_at=datetime.now(UTC)
             )
 
             # Use group-specific topic name according to proxy specification
@@ -89,7 +89,7 @@ class MessagePublisher(IMessagePublisher):
                 envelope=envelope,
                 payload=payload,
                 message_type=ServiceBusMessageType.RESPONSE,
-                created_at=datetime.utcnow()
+                created_at=datetime.now(UTC)
             )
 
             # Use group-specific topic name according to proxy specification
@@ -132,7 +132,7 @@ class MessagePublisher(IMessagePublisher):
                 envelope=envelope,
                 payload=payload,
                 message_type=ServiceBusMessageType.NOTIFICATION,
-                created_at=datetime.utcnow()
+                created_at=datetime.now(UTC)
             )
 
             # Use correlation_id as session_id if none provided (required for ordered delivery)
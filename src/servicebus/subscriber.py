@@ -210,7 +210,7 @@ class MessageSubscriber:
                         current_proxy_id = config.id if config else "unknown-proxy"
 
                         # Create a ServiceBusMessage with proper routing properties
-                        from datetime import datetime
+                        from datetime import UTC, datetime
                         from uuid import uuid4
 
                         from .models import ServiceBusMessage, ServiceBusMessageType
@@ -246,7 +246,7 @@ class MessageSubscriber:
                             envelope=response_envelope,
                             payload=response_payload,
                             message_type=ServiceBusMessageType.RESPONSE,
-                            created_at=datetime.utcnow(),
+                            created_at=datetime.now(UTC),
                             properties={
                                 "fromProxy": current_proxy_id,
                                 "toProxy": envelope.fromProxy  # Route back to original proxy
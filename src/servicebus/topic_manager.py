@@ -4,10 +4,12 @@ import asyncio
 import logging
 from datetime import timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 from concurrent.futures import ThreadPoolExecutor
 
+import requests
 from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError, HttpResponseError
+from azure.core.pipeline.transport import HttpTransport, RequestsTransport
 from azure.servicebus.management import ServiceBusAdministrationClient
 from azure.identity import DefaultAzureCredential
 from pydantic import BaseModel, Field
@@ -18,6 +20,28 @@ from ..core.exceptions import A2AProxyError
 logger = logging.getLogger(__name__)
 
 
+def create_shared_transport() -> RequestsTransport:
+    """Create an HTTP transport whose connection pool outlives individual admin clients.
+
+    The transport does not own its session, so closing an admin client leaves the
+    pooled connections open for the next one. The caller closes it with
+    ``close_shared_transport`` once no client uses it any more.
+    """
+    return RequestsTransport(session=requests.Session(), session_owner=False)
+
+
+def close_shared_transport(transport: RequestsTransport) -> None:
+    """Close the session behind a transport from ``create_shared_transport``."""
+    if transport.session is not None:
+        transport.session.close()
+        transport.session = None
+
+
+async def _sleep(delay: float) -> None:
+    """Wait out a retry backoff; module-level so tests can skip the real delay."""
+    await asyncio.sleep(delay)
+
+
 class TopicType(str, Enum):
     """Types of topics for each agent group."""
     REQUEST = "requests"
@@ -75,15 +99,28 @@ class TopicHealthResult(BaseModel):
 class TopicManager:
     """Manages Service Bus topics for agent groups."""
     
-    def __init__(self, namespace: str, connection_string: Optional[str] = None) -> None:
+    # Prefix shared by every topic this manager owns
+    _MANAGED_PREFIX = "a2a."
+    
+    def __init__(
+        self,
+        namespace: str,
+        connection_string: Optional[str] = None,
+        max_concurrency: int = 8,
+        transport: Optional[HttpTransport] = None
+    ) -> None:
         """Initialize the topic manager.
         
         Args:
             namespace: Service Bus namespace
             connection_string: Optional connection string (uses managed identity if None)
+            max_concurrency: Maximum number of agent groups provisioned at once
+            transport: Optional shared HTTP transport; its lifetime is owned by the caller
         """
         self.namespace = namespace
         self.connection_string = connection_string
+        self._max_concurrency = max_concurrency
+        self._transport = transport
         self._admin_client: Optional[ServiceBusAdministrationClient] = None
         self._executor = ThreadPoolExecutor(max_workers=4)
         self._retry_config = {
@@ -113,7 +150,8 @@ class TopicManager:
         try:
             if self.connection_string:
                 self._admin_client = ServiceBusAdministrationClient.from_connection_string(
-                    self.connection_string
+                    self.connection_string,
+                    transport=self._transport
                 )
                 logger.info("Connected to Service Bus administration using connection string")
             else:
@@ -121,7 +159,8 @@ class TopicManager:
                 fully_qualified_namespace = self._get_fully_qualified_namespace()
                 self._admin_client = ServiceBusAdministrationClient(
                     fully_qualified_namespace=fully_qualified_namespace,
-                    credential=credential
+                    credential=credential,
+                    transport=self._transport
                 )
                 logger.info(f"Connected to Service Bus administration using managed identity: {fully_qualified_namespace}")
                 
@@ -203,7 +242,7 @@ class TopicManager:
                 last_exception = e
                 if attempt < self._retry_config['max_attempts'] - 1:
                     logger.warning(f"Operation failed (attempt {attempt + 1}), retrying in {delay}s: {str(e)}")
-                    await asyncio.sleep(delay)
+                    await _sleep(delay)
                     delay = min(delay * self._retry_config['exponential_base'], self._retry_config['max_delay'])
                 else:
                     logger.error(f"Operation failed after {self._retry_config['max_attempts']} attempts: {str(e)}")
@@ -212,12 +251,43 @@ class TopicManager:
             raise last_exception
         raise A2AProxyError("Operation failed without exception")
     
-    async def _create_single_topic(self, topic_name: str, config: TopicGroupConfig) -> TopicOperationResult:
+    async def _snapshot_topics(self) -> Optional[Set[str]]:
+        """Fetch the names of all existing topics in one listing.
+        
+        Returns:
+            Set of topic names, or None if the listing failed and callers
+            should probe each topic individually
+        """
+        if not self._admin_client:
+            raise A2AProxyError("Topic manager not connected")
+        
+        def _list_topic_names() -> Set[str]:
+            if not self._admin_client:
+                raise A2AProxyError("Admin client not connected")
+            return {topic.name for topic in self._admin_client.list_topics()}
+        
+        try:
+            topic_names: Set[str] = await self._retry_operation(_list_topic_names)
+            return topic_names
+        except Exception as e:
+            logger.warning(f"Failed to snapshot topics, probing individually: {str(e)}")
+            return None
+    
+    async def _create_single_topic(
+        self,
+        topic_name: str,
+        config: TopicGroupConfig,
+        existing_topics: Optional[Set[str]] = None,
+        topic_kwargs: Optional[Dict[str, Any]] = None
+    ) -> TopicOperationResult:
         """Create or update a single topic.
         
         Args:
             topic_name: Name of the topic to create
             config: Agent group configuration
+            existing_topics: Optional snapshot of existing topic names; when
+                given, it replaces the per-topic existence probe
+            topic_kwargs: Optional precomputed creation parameters for config
             
         Returns:
             Result of the topic operation
@@ -227,35 +297,42 @@ class TopicManager:
         
         try:
             # Check if topic exists
-            try:
-                existing_topic = await self._retry_operation(
-                    self._admin_client.get_topic,
-                    topic_name
-                )
-                
+            if existing_topics is not None:
+                exists = topic_name in existing_topics
+            else:
+                try:
+                    await self._retry_operation(
+                        self._admin_client.get_topic,
+                        topic_name
+                    )
+                    exists = True
+                except ResourceNotFoundError:
+                    exists = False
+            
+            if exists:
                 logger.debug(f"Topic already exists with correct properties: {topic_name}")
                 return TopicOperationResult(
                     topic_name=topic_name,
                     status=TopicStatus.EXISTS,
                     message="Topic already exists"
                 )
-                    
-            except ResourceNotFoundError:
-                # Topic doesn't exist, create it
+            
+            # Topic doesn't exist, create it
+            if topic_kwargs is None:
                 topic_kwargs = self._create_topic_properties(config, topic_name)
-                
-                created_topic = await self._retry_operation(
-                    self._admin_client.create_topic,
-                    topic_name,
-                    **topic_kwargs
-                )
-                
-                logger.info(f"Created topic: {topic_name}")
-                return TopicOperationResult(
-                    topic_name=topic_name,
-                    status=TopicStatus.CREATED,
-                    message="Topic created successfully"
-                )
+            
+            await self._retry_operation(
+                self._admin_client.create_topic,
+                topic_name,
+                **topic_kwargs
+            )
+            
+            logger.info(f"Created topic: {topic_name}")
+            return TopicOperationResult(
+                topic_name=topic_name,
+                status=TopicStatus.CREATED,
+                message="Topic created successfully"
+            )
                 
         except ResourceExistsError:
             # Topic was created by another process between check and create
@@ -276,11 +353,16 @@ class TopicManager:
                 error=error_msg
             )
     
-    async def create_topic_set(self, group_config: TopicGroupConfig) -> TopicSetResult:
+    async def create_topic_set(
+        self,
+        group_config: TopicGroupConfig,
+        existing_topics: Optional[Set[str]] = None
+    ) -> TopicSetResult:
         """Create request, response, and DLQ topics for a group.
         
         Args:
             group_config: Configuration for the agent group
+            existing_topics: Optional snapshot of existing topic names
             
         Returns:
             Results of creating all topics in the set
@@ -290,13 +372,16 @@ class TopicManager:
         
         logger.info(f"Creating topic set for group: {group_config.name}")
         
+        # The three topics share one set of creation parameters
+        topic_kwargs = self._get_topic_properties(group_config)
+        
         # Create all topics concurrently
         tasks = []
         topic_types = [TopicType.REQUEST, TopicType.RESPONSE, TopicType.DEADLETTER]
         
         for topic_type in topic_types:
             topic_name = self._get_topic_name(group_config.name, topic_type)
-            task = self._create_single_topic(topic_name, group_config)
+            task = self._create_single_topic(topic_name, group_config, existing_topics, topic_kwargs)
             tasks.append(task)
         
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -344,8 +429,17 @@ class TopicManager:
             self._connect()
         
         try:
-            # Create topic sets for all groups concurrently
-            tasks = [self.create_topic_set(group) for group in groups]
+            # One listing answers every existence check below
+            existing_topics = await self._snapshot_topics()
+
+            # Create topic sets concurrently, capping how many groups are in flight
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+
+            async def create_bounded(group: TopicGroupConfig) -> TopicSetResult:
+                async with semaphore:
+                    return await self.create_topic_set(group, existing_topics)
+
+            tasks = [create_bounded(group) for group in groups]
             results = await asyncio.gather(*tasks, return_exceptions=True)
             
             # Process results
@@ -401,29 +495,35 @@ class TopicManager:
         
         logger.debug(f"Validating topic health for group: {group_name}")
         
+        if not self._admin_client:
+            raise A2AProxyError("Admin client not connected")
+        
         topic_types = [TopicType.REQUEST, TopicType.RESPONSE, TopicType.DEADLETTER]
+        topic_names = [self._get_topic_name(group_name, topic_type) for topic_type in topic_types]
         health_result = TopicHealthResult(group_name=group_name, status=TopicHealthStatus.HEALTHY)
         
-        for topic_type in topic_types:
-            topic_name = self._get_topic_name(group_name, topic_type)
-            try:
-                if not self._admin_client:
-                    raise A2AProxyError("Admin client not connected")
-                topic = await self._retry_operation(self._admin_client.get_topic, topic_name)
-                health_result.topics[topic_name] = True
-                logger.debug(f"Topic {topic_name} is healthy")
-                
-            except ResourceNotFoundError:
+        # Look up all topics concurrently; the slowest lookup bounds the check
+        lookups = await asyncio.gather(
+            *(self._retry_operation(self._admin_client.get_topic, topic_name) for topic_name in topic_names),
+            return_exceptions=True
+        )
+        
+        for topic_name, lookup in zip(topic_names, lookups, strict=True):
+            if isinstance(lookup, ResourceNotFoundError):
                 health_result.topics[topic_name] = False
                 health_result.errors.append(f"Topic {topic_name} not found")
                 health_result.status = TopicHealthStatus.UNHEALTHY
                 logger.warning(f"Topic {topic_name} not found")
                 
-            except Exception as e:
+            elif isinstance(lookup, BaseException):
                 health_result.topics[topic_name] = False
-                health_result.errors.append(f"Topic {topic_name} error: {str(e)}")
+                health_result.errors.append(f"Topic {topic_name} error: {str(lookup)}")
                 health_result.status = TopicHealthStatus.DEGRADED
-                logger.error(f"Error checking topic {topic_name}: {str(e)}")
+                logger.error(f"Error checking topic {topic_name}: {str(lookup)}")
+                
+            else:
+                health_result.topics[topic_name] = True
+                logger.debug(f"Topic {topic_name} is healthy")
         
         # Update overall status based on results
         if not any(health_result.topics.values()):
@@ -446,11 +546,11 @@ class TopicManager:
             def _list_topics() -> List[str]:
                 if not self._admin_client:
                     raise A2AProxyError("Admin client not connected")
-                all_topics = []
-                for topic in self._admin_client.list_topics():
-                    if topic.name.startswith("a2a."):
-                        all_topics.append(topic.name)
-                return all_topics
+                return [
+                    topic.name
+                    for topic in self._admin_client.list_topics()
+                    if topic.name.startswith(self._MANAGED_PREFIX)
+                ]
             
             topics = await self._retry_operation(_list_topics)
             logger.debug(f"Found {len(topics)} managed topics")
@@ -474,25 +574,31 @@ class TopicManager:
         
         logger.warning(f"Deleting topic set for group: {group_name}")
         
+        if not self._admin_client:
+            raise A2AProxyError("Admin client not connected")
+        
         topic_types = [TopicType.REQUEST, TopicType.RESPONSE, TopicType.DEADLETTER]
+        topic_names = [self._get_topic_name(group_name, topic_type) for topic_type in topic_types]
         results = {}
         
-        for topic_type in topic_types:
-            topic_name = self._get_topic_name(group_name, topic_type)
-            try:
-                if not self._admin_client:
-                    raise A2AProxyError("Admin client not connected")
-                await self._retry_operation(self._admin_client.delete_topic, topic_name)
-                results[topic_name] = True
-                logger.info(f"Deleted topic: {topic_name}")
-                
-            except ResourceNotFoundError:
+        # Deletes are independent, so issue them together
+        outcomes = await asyncio.gather(
+            *(self._retry_operation(self._admin_client.delete_topic, topic_name) for topic_name in topic_names),
+            return_exceptions=True
+        )
+        
+        for topic_name, outcome in zip(topic_names, outcomes, strict=True):
+            if isinstance(outcome, ResourceNotFoundError):
                 results[topic_name] = True  # Already deleted
                 logger.info(f"Topic already deleted: {topic_name}")
                 
-            except Exception as e:
+            elif isinstance(outcome, BaseException):
                 results[topic_name] = False
-                logger.error(f"Failed to delete topic {topic_name}: {str(e)}")
+                logger.error(f"Failed to delete topic {topic_name}: {str(outcome)}")
+                
+            else:
+                results[topic_name] = True
+                logger.info(f"Deleted topic: {topic_name}")
         
         return results
     
@@ -2,6 +2,8 @@
 
 import asyncio
 import json
+import os
+from contextlib import AsyncExitStack
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -13,6 +15,9 @@ import aiofiles.os
 from .models import ISessionStore, SessionInfo, SessionStats
 from types import TracebackType
 
+# Number of lock shards; must be a power of two so shard selection is a mask
+LOCK_SHARDS = 16
+
 
 class FileSessionStore(ISessionStore):
     """File-based implementation of session storage."""
@@ -24,7 +29,8 @@ class FileSessionStore(ISessionStore):
             storage_path: Directory path for storing session files
         """
         self.storage_path = Path(storage_path)
-        self._lock = asyncio.Lock()
+        # Per-shard locks so writes to unrelated sessions never contend
+        self._locks = [asyncio.Lock() for _ in range(LOCK_SHARDS)]
 
     async def __aenter__(self) -> "FileSessionStore":
         """Async context manager entry."""
@@ -47,6 +53,10 @@ class FileSessionStore(ISessionStore):
         except OSError as e:
             raise RuntimeError(f"Failed to create session storage directory: {e}")
 
+    def _lock_for(self, session_id: str) -> asyncio.Lock:
+        """Get the lock shard guarding a session."""
+        return self._locks[hash(session_id) & (LOCK_SHARDS - 1)]
+
     def _get_session_file_path(self, session_id: str) -> Path:
         """Get the file path for a session."""
         return self.storage_path / f"{session_id}.json"
@@ -105,6 +115,30 @@ class FileSessionStore(ISessionStore):
         except OSError:
             return False
 
+    def _unlink_session_files(self, file_paths: list[Path]) -> int:
+        """Unlink session files and sync the storage directory once (runs in a thread)."""
+        removed_count = 0
+        for file_path in file_paths:
+            try:
+                os.unlink(file_path)
+                removed_count += 1
+            except OSError:
+                # Already gone or not removable; leave it to the next pass
+                continue
+
+        # One directory sync makes the whole batch of unlinks durable
+        if removed_count and hasattr(os, "O_DIRECTORY"):
+            try:
+                dir_fd = os.open(self.storage_path, os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            except OSError:
+                pass
+
+        return removed_count
+
     async def create_session(
         self,
         agent_id: str,
@@ -113,9 +147,9 @@ class FileSessionStore(ISessionStore):
         metadata: dict[str, Any] | None = None
     ) -> SessionInfo:
         """Create a new session."""
-        async with self._lock:
-            session_id = str(uuid4())
+        session_id = str(uuid4())
 
+        async with self._lock_for(session_id):
             session_info = SessionInfo(
                 session_id=session_id,
                 agent_id=agent_id,
@@ -136,20 +170,58 @@ class FileSessionStore(ISessionStore):
 
     async def update_session(self, session_info: SessionInfo) -> bool:
         """Update an existing session."""
-        async with self._lock:
-            # Check if session exists
-            existing = await self._load_session_file(session_info.session_id)
-            if existing is None:
+        async with self._lock_for(session_info.session_id):
+            # An existence check is enough; parsing the old contents only to discard them doubles the I/O
+            file_path = self._get_session_file_path(session_info.session_id)
+            if not await aiofiles.os.path.exists(file_path):
                 return False
 
             await self._save_session_file(session_info)
             return True
 
+    async def extend_ttl(self, session_id: str, ttl_seconds: int) -> SessionInfo | None:
+        """Extend a live session's TTL in a single read-modify-write."""
+        async with self._lock_for(session_id):
+            session_info = await self._load_session_file(session_id)
+            if session_info is None or session_info.is_expired():
+                return None
+
+            session_info.extend_ttl(ttl_seconds)
+            await self._save_session_file(session_info)
+            return session_info
+
+    async def touch(self, session_id: str, last_activity: datetime) -> bool:
+        """Persist a session's last activity in a read-modify-write, keeping concurrent edits."""
+        async with self._lock_for(session_id):
+            session_info = await self._load_session_file(session_id)
+            if session_info is None:
+                return False
+
+            # Never move activity backwards past a newer write such as extend_ttl
+            if session_info.last_activity < last_activity:
+                session_info.last_activity = last_activity
+                await self._save_session_file(session_info)
+            return True
+
     async def delete_session(self, session_id: str) -> bool:
         """Delete a session."""
-        async with self._lock:
+        async with self._lock_for(session_id):
             return await self._delete_session_file(session_id)
 
+    async def delete_sessions_batch(self, session_ids: list[str]) -> int:
+        """Delete several sessions with a single directory sync."""
+        if not session_ids:
+            return 0
+
+        # Take each affected shard lock once, in index order to avoid deadlocks
+        shard_indexes = sorted({hash(session_id) & (LOCK_SHARDS - 1) for session_id in session_ids})
+        async with AsyncExitStack() as stack:
+            for index in shard_indexes:
+                await stack.enter_async_context(self._locks[index])
+
+            file_paths = [self._get_session_file_path(session_id) for session_id in session_ids]
+            return await asyncio.to_thread(self._unlink_session_files, file_paths)
+
     async def list_sessions(
         self,
         agent_id: str | None = None,
@@ -185,22 +257,23 @@ class FileSessionStore(ISessionStore):
 
     async def cleanup_expired_sessions(self) -> int:
         """Remove expired sessions and return count removed."""
-        async with self._lock:
-            removed_count = 0
+        removed_count = 0
 
-            try:
-                for file_path in self.storage_path.glob("*.json"):
-                    session_id = file_path.stem
+        try:
+            for file_path in self.storage_path.glob("*.json"):
+                session_id = file_path.stem
+
+                async with self._lock_for(session_id):
                     session_info = await self._load_session_file(session_id)
 
                     if session_info is not None and session_info.is_expired():
                         if await self._delete_session_file(session_id):
                             removed_count += 1
 
-            except OSError:
-                pass
+        except OSError:
+            pass
 
-            return removed_count
+        return removed_count
 
     async def get_stats(self) -> SessionStats:
         """Get session storage statistics."""
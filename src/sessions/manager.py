@@ -1,10 +1,14 @@
 """Session manager for coordinating session operations."""
 
 import asyncio
+import heapq
 import logging
+import time
+from datetime import datetime, timedelta
 from typing import Any
 from types import TracebackType
 
+from ..core import clock
 from .file_store import FileSessionStore
 from .models import ISessionStore, SessionConfig, SessionInfo, SessionStats
 
@@ -25,6 +29,17 @@ class SessionManager:
         self.session_store = session_store or FileSessionStore(config.session_store_path)
         self._cleanup_task: asyncio.Task | None = None
         self._running = False
+        # Min-heap of (expires_at, session_id); may hold stale entries for
+        # sessions that were extended or deleted since they were pushed.
+        self._expiry_heap: list[tuple[datetime, str]] = []
+        # Consecutive failed cleanup attempts per session, for retry backoff
+        self._cleanup_failures: dict[str, int] = {}
+        # Monotonic time of the last persisted write per session, for touch debouncing
+        self._last_flush_ts: dict[str, float] = {}
+        self._cleanup_sem = asyncio.Semaphore(config.cleanup_concurrency)
+        # Touched sessions awaiting a background write; the latest activity wins
+        self._dirty: dict[str, datetime] = {}
+        self._flush_task: asyncio.Task | None = None
 
     async def __aenter__(self) -> "SessionManager":
         """Async context manager entry."""
@@ -51,6 +66,11 @@ class SessionManager:
         if isinstance(self.session_store, FileSessionStore):
             await self.session_store.__aenter__()
 
+        # Seed the expiry heap with sessions persisted by a previous run
+        self._expiry_heap = []
+        for session_info in await self.session_store.list_sessions(include_expired=True):
+            self._track_expiry(session_info)
+
         # Start cleanup task
         self._running = True
         self._cleanup_task = asyncio.create_task(self._cleanup_loop())
@@ -71,32 +91,142 @@ class SessionManager:
             try:
                 await self._cleanup_task
             except asyncio.CancelledError:
-                pass        # Cleanup session store
+                pass
+
+        # Persist any queued last-activity updates
+        if self._flush_task is not None:
+            await self._flush_task
+            self._flush_task = None
+        await self._flush_dirty()
+
+        # Cleanup session store
         if isinstance(self.session_store, FileSessionStore):
             await self.session_store.__aexit__(None, None, None)
 
         logger.info("Session manager stopped")
 
+    def _track_expiry(self, session_info: SessionInfo) -> None:
+        """Record a session's expiration deadline in the expiry heap."""
+        if session_info.expires_at is not None:
+            heapq.heappush(self._expiry_heap, (session_info.expires_at, session_info.session_id))
+
+    def _mark_dirty(self, session_info: SessionInfo) -> None:
+        """Queue a touched session for background persistence."""
+        self._dirty[session_info.session_id] = session_info.last_activity
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_dirty())
+
+    async def _flush_dirty(self) -> None:
+        """Write queued last-activity updates to the store until the dirty map is drained."""
+        while self._dirty:
+            items = list(self._dirty.items())
+            self._dirty.clear()
+
+            # Only last_activity is persisted so a concurrent extend or update is never overwritten
+            results = await asyncio.gather(
+                *(self.session_store.touch(session_id, last_activity) for session_id, last_activity in items),
+                return_exceptions=True
+            )
+
+            now = time.monotonic()
+            for (session_id, _), result in zip(items, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.error("Failed to persist activity for session %s: %s", session_id, result)
+                elif result:
+                    self._last_flush_ts[session_id] = now
+
+    def _drop_dirty(self, session_id: str) -> None:
+        """Drop a queued touch ahead of a direct write to the same session."""
+        # An in-flight touch needs no wait: the store only ever moves last_activity forward
+        self._dirty.pop(session_id, None)
+
+    def _next_cleanup_delay(self) -> float:
+        """Seconds until the next cleanup pass, capped by the cleanup interval."""
+        delay = float(self.config.cleanup_interval_seconds)
+        if self._expiry_heap:
+            until_next = (self._expiry_heap[0][0] - clock.utcnow()).total_seconds()
+            delay = min(delay, max(until_next, 0.0))
+        return delay
+
+    def _retry_cleanup(self, session_id: str, now: datetime) -> None:
+        """Re-queue a session whose cleanup failed, backing off exponentially."""
+        failures = self._cleanup_failures.get(session_id, 0) + 1
+        self._cleanup_failures[session_id] = failures
+        delay = min(2.0 ** (failures - 1), float(self.config.cleanup_interval_seconds))
+        heapq.heappush(self._expiry_heap, (now + timedelta(seconds=delay), session_id))
+
+    async def _is_still_due(self, session_id: str, due_at: datetime) -> bool:
+        """Check a popped heap entry against the stored session, bounded by the cleanup semaphore."""
+        async with self._cleanup_sem:
+            # Stale entries: the session is gone or its TTL was extended past the entry
+            session_info = await self.session_store.get_session(session_id)
+            return (
+                session_info is not None
+                and session_info.expires_at is not None
+                and session_info.expires_at <= due_at
+            )
+
+    async def _cleanup_due_sessions(self) -> int:
+        """Remove sessions whose deadline has passed, popping only due heap entries."""
+        now = clock.utcnow()
+        due: list[tuple[datetime, str]] = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            due.append(heapq.heappop(self._expiry_heap))
+
+        if not due:
+            return 0
+
+        results = await asyncio.gather(
+            *(self._is_still_due(session_id, due_at) for due_at, session_id in due),
+            return_exceptions=True
+        )
+
+        # Insertion-ordered set: one session can have several due heap entries
+        expired_ids: dict[str, None] = {}
+        for (_, session_id), result in zip(due, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error("Failed to check expired session %s: %s", session_id, result)
+                self._retry_cleanup(session_id, now)
+            elif result:
+                expired_ids[session_id] = None
+            else:
+                self._cleanup_failures.pop(session_id, None)
+
+        # Delete the whole batch at once so the store can sync the directory a single time
+        try:
+            removed_count = await self.session_store.delete_sessions_batch(list(expired_ids))
+        except Exception as e:
+            logger.error("Failed to delete %d expired sessions: %s", len(expired_ids), e)
+            for session_id in expired_ids:
+                self._retry_cleanup(session_id, now)
+            return 0
+
+        for session_id in expired_ids:
+            self._cleanup_failures.pop(session_id, None)
+            self._last_flush_ts.pop(session_id, None)
+
+        return removed_count
+
     async def _cleanup_loop(self) -> None:
         """Background task for cleaning up expired sessions."""
         while self._running:
             try:
-                # Wait for cleanup interval
-                await asyncio.sleep(self.config.cleanup_interval_seconds)
+                # Wait until the next deadline or the cleanup interval, whichever is sooner
+                await asyncio.sleep(self._next_cleanup_delay())
 
                 # Double-check if still running after sleep
                 if not self._running:
                     break
 
                 # Cleanup expired sessions - this is reachable when _running is True
-                removed_count = await self.session_store.cleanup_expired_sessions()
+                removed_count = await self._cleanup_due_sessions()
                 if removed_count > 0:
-                    logger.info(f"Cleaned up {removed_count} expired sessions")
+                    logger.info("Cleaned up %d expired sessions", removed_count)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Error in session cleanup: {e}")
+                logger.error("Error in session cleanup: %s", e)
                 # Continue running even if cleanup fails
 
     async def create_session(
@@ -121,8 +251,6 @@ class SessionManager:
         if len(existing_sessions) >= self.config.max_sessions_per_agent:
             raise ValueError(f"Agent {agent_id} has reached maximum session limit ({self.config.max_sessions_per_agent})")
 
-        logger.info(f"Creating session for agent {agent_id} with TTL {ttl_seconds}s")
-
         session_info = await self.session_store.create_session(
             agent_id=agent_id,
             correlation_id=correlation_id,
@@ -130,7 +258,12 @@ class SessionManager:
             metadata=metadata
         )
 
-        logger.info(f"Created session {session_info.session_id} for agent {agent_id}")
+        self._track_expiry(session_info)
+        self._last_flush_ts[session_info.session_id] = time.monotonic()
+
+        logger.info(
+            "Created session %s for agent %s with TTL %ds", session_info.session_id, agent_id, ttl_seconds
+        )
         return session_info
 
     async def get_session(self, session_id: str, touch: bool = True) -> SessionInfo | None:
@@ -145,14 +278,17 @@ class SessionManager:
 
         # Check if expired
         if session_info.is_expired():
-            logger.info(f"Session {session_id} has expired, removing it")
+            logger.info("Session %s has expired, removing it", session_id)
             await self.session_store.delete_session(session_id)
+            self._last_flush_ts.pop(session_id, None)
             return None
 
-        # Update last activity if requested
+        # Update last activity if requested, queueing a write at most once per debounce window
         if touch:
             session_info.touch()
-            await self.session_store.update_session(session_info)
+            last_flush = self._last_flush_ts.get(session_id)
+            if last_flush is None or time.monotonic() - last_flush >= self.config.touch_debounce_seconds:
+                self._mark_dirty(session_info)
 
         return session_info
 
@@ -161,14 +297,22 @@ class SessionManager:
         if not self._running:
             raise RuntimeError("Session manager is not running")
 
-        return await self.session_store.update_session(session_info)
+        self._drop_dirty(session_info.session_id)
+        success = await self.session_store.update_session(session_info)
+        if success:
+            self._track_expiry(session_info)
+            self._last_flush_ts[session_info.session_id] = time.monotonic()
+
+        return success
 
     async def delete_session(self, session_id: str) -> bool:
         """Delete a session."""
         if not self._running:
             raise RuntimeError("Session manager is not running")
 
-        logger.info(f"Deleting session {session_id}")
+        logger.info("Deleting session %s", session_id)
+        self._drop_dirty(session_id)
+        self._last_flush_ts.pop(session_id, None)
         return await self.session_store.delete_session(session_id)
 
     async def extend_session(self, session_id: str, ttl_seconds: int) -> bool:
@@ -176,20 +320,19 @@ class SessionManager:
         if not self._running:
             raise RuntimeError("Session manager is not running")
 
-        session_info = await self.get_session(session_id, touch=False)
-        if session_info is None:
-            return False
-
         # Validate TTL
         ttl_seconds = self.config.validate_ttl(ttl_seconds)
 
-        session_info.extend_ttl(ttl_seconds)
-        success = await self.session_store.update_session(session_info)
+        self._drop_dirty(session_id)
+        session_info = await self.session_store.extend_ttl(session_id, ttl_seconds)
+        if session_info is None:
+            return False
 
-        if success:
-            logger.info(f"Extended session {session_id} TTL to {ttl_seconds}s")
+        self._track_expiry(session_info)
+        self._last_flush_ts[session_id] = time.monotonic()
+        logger.info("Extended session %s TTL to %ds", session_id, ttl_seconds)
 
-        return success
+        return True
 
     async def list_sessions(
         self,
@@ -221,4 +364,5 @@ class SessionManager:
         if not self._running:
             raise RuntimeError("Session manager is not running")
 
-        return await self.session_store.cleanup_expired_sessions()
+        # Same path as the background loop so per-session bookkeeping is pruned too
+        return await self._cleanup_due_sessions()
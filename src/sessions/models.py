@@ -7,6 +7,8 @@ from types import TracebackType
 
 from pydantic import BaseModel, Field
 
+from ..core import clock
+
 
 class SessionInfo(BaseModel):
     """Information about an active session."""
@@ -14,8 +16,8 @@ class SessionInfo(BaseModel):
     session_id: str = Field(..., description="Unique session identifier")
     agent_id: str = Field(..., description="Agent this session belongs to")
     correlation_id: str | None = Field(None, description="Correlation ID for message ordering")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Session creation time")
-    last_activity: datetime = Field(default_factory=datetime.utcnow, description="Last activity timestamp")
+    created_at: datetime = Field(default_factory=lambda: clock.utcnow(), description="Session creation time")
+    last_activity: datetime = Field(default_factory=lambda: clock.utcnow(), description="Last activity timestamp")
     expires_at: datetime | None = Field(None, description="Session expiration time")
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional session metadata")
 
@@ -23,16 +25,16 @@ class SessionInfo(BaseModel):
         """Check if the session has expired."""
         if self.expires_at is None:
             return False
-        return datetime.utcnow() > self.expires_at
+        return clock.utcnow() > self.expires_at
 
     def extend_ttl(self, ttl_seconds: int) -> None:
         """Extend the session TTL."""
-        self.expires_at = datetime.utcnow() + timedelta(seconds=ttl_seconds)
-        self.last_activity = datetime.utcnow()
+        self.expires_at = clock.utcnow() + timedelta(seconds=ttl_seconds)
+        self.last_activity = clock.utcnow()
 
     def touch(self) -> None:
         """Update last activity timestamp."""
-        self.last_activity = datetime.utcnow()
+        self.last_activity = clock.utcnow()
 
 
 class SessionStats(BaseModel):
@@ -83,11 +85,26 @@ class ISessionStore(ABC):
         """Update an existing session."""
         pass
 
+    @abstractmethod
+    async def extend_ttl(self, session_id: str, ttl_seconds: int) -> SessionInfo | None:
+        """Extend a live session's TTL in a single read-modify-write."""
+        pass
+
+    @abstractmethod
+    async def touch(self, session_id: str, last_activity: datetime) -> bool:
+        """Persist only a session's last activity, leaving other fields untouched."""
+        pass
+
     @abstractmethod
     async def delete_session(self, session_id: str) -> bool:
         """Delete a session."""
         pass
 
+    @abstractmethod
+    async def delete_sessions_batch(self, session_ids: list[str]) -> int:
+        """Delete several sessions and return count removed."""
+        pass
+
     @abstractmethod
     async def list_sessions(
         self,
@@ -119,7 +136,9 @@ class SessionConfig(BaseModel):
     default_ttl_seconds: int = Field(default=3600, description="Default session TTL in seconds")
     max_ttl_seconds: int = Field(default=86400, description="Maximum session TTL in seconds")
     cleanup_interval_seconds: int = Field(default=300, description="Cleanup interval in seconds")
+    cleanup_concurrency: int = Field(default=32, description="Maximum concurrent expiry checks per cleanup pass")
     max_sessions_per_agent: int = Field(default=100, description="Maximum sessions per agent")
+    touch_debounce_seconds: int = Field(default=30, description="Minimum seconds between persisted last-activity updates")
     session_store_type: str = Field(default="file", description="Session store implementation type")
     session_store_path: str = Field(default="./data/sessions", description="Path for file-based session store")
 
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """Startup script for A2A Service Bus Proxy."""
 
-import sys
+import argparse
+import os
 import uvicorn
 from pathlib import Path
 
@@ -18,19 +19,7 @@ def get_port_from_config(config_file: str) -> int:
         print(f"[WARNING] Could not read port from config file {config_file}: {e}")
     return 8080
 
-def show_help():
-    """Show help message."""
-    print("""A2A Service Bus Proxy
-
-Usage: python start_proxy.py [OPTIONS] [CONFIG_FILE]
-
-Options:
-  -c, --config FILE     Configuration file (default: config/proxy-config.yaml)
-  --host HOST           Host to bind to (default: 0.0.0.0)
-  -p, --port PORT       Port to bind to (default: read from config file)
-  --help                Show this help message
-
-Examples:
+HELP_EPILOG = """Examples:
   python start_proxy.py                                    # Use default config
   python start_proxy.py config/proxy-writer.yaml          # Use specific config
   python start_proxy.py --config config/proxy-critic.yaml # Use specific config with flag
@@ -41,49 +30,39 @@ Available configurations:
   config/proxy-writer.yaml      (port 8082) 
   config/proxy-critic.yaml      (port 8081)
   config/proxy-follower.yaml    (port 8083)
-""")
+"""
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    parser = argparse.ArgumentParser(
+        description="A2A Service Bus Proxy",
+        epilog=HELP_EPILOG,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('config_file', nargs='?', metavar='CONFIG_FILE',
+                        help='Configuration file (.yaml/.yml)')
+    parser.add_argument('-c', '--config', dest='config_flag', metavar='FILE',
+                        help='Configuration file (default: config/proxy-config.yaml)')
+    parser.add_argument('--host', default='0.0.0.0',
+                        help='Host to bind to (default: 0.0.0.0)')
+    parser.add_argument('-p', '--port', type=int, default=None,
+                        help='Port to bind to (default: read from config file)')
+    return parser
 
 def main():
     """Main entry point for the proxy."""
-    
-    # Check for help first
-    if '--help' in sys.argv or '-help' in sys.argv:
-        show_help()
-        return
-    
-    # Default configuration
-    config_file = "config/proxy-config.yaml"
-    host = "0.0.0.0"
-    port = None  # Will be read from config if not specified
-    
-    # Parse command line arguments
-    args = sys.argv[1:]
-    i = 0
-    while i < len(args):
-        arg = args[i]
-        if arg in ['--config', '-c'] and i + 1 < len(args):
-            config_file = args[i + 1]
-            i += 2
-        elif arg in ['--host'] and i + 1 < len(args):  # Remove -h to avoid conflict with help
-            host = args[i + 1]
-            i += 2
-        elif arg in ['--port', '-p'] and i + 1 < len(args):
-            port = int(args[i + 1])
-            i += 2
-        elif arg.endswith('.yaml') or arg.endswith('.yml'):
-            # Config file without flag
-            config_file = arg
-            i += 1
-        else:
-            i += 1
+    args, _ = build_parser().parse_known_args()
+
+    config_file = args.config_flag or args.config_file or "config/proxy-config.yaml"
+    host = args.host
+    port = args.port  # Will be read from config if not specified
     
     # If port not explicitly specified, read from config
     if port is None:
         port = get_port_from_config(config_file)
     
-    # Set the config file in sys.argv so our main module can find it
-    if config_file not in sys.argv:
-        sys.argv.append(config_file)
+    # Hand the config file to src.main explicitly instead of via sys.argv
+    os.environ['CONFIG_PATH'] = config_file
     
     print(f"[INFO] Starting A2A Proxy with config: {config_file}")
     print(f"[INFO] Server will listen on {host}:{port}")
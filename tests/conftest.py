@@ -2,18 +2,67 @@
 
 import os
 import sys
+from datetime import datetime, timedelta
 
 import pytest
+import pytest_asyncio
 
 # Add src to Python path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 
-@pytest.fixture(scope="session")
-def event_loop_policy():
-    """Use the default event loop policy for asyncio tests."""
+def pytest_asyncio_loop_factories(config, item):
+    """Run asyncio tests on uvloop when it is available."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return {"uvloop": uvloop.new_event_loop}
+
     import asyncio
-    return asyncio.DefaultEventLoopPolicy()
+    return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI application under test, shared by every test module."""
+    from src.main import app as proxy_app
+
+    return proxy_app
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def pending_manager():
+    """A started PendingRequestManager shared by the tests of one module.
+
+    The cleanup interval is long enough that the background loop never fires;
+    tests call ``_cleanup_expired_requests()`` directly when they need it.
+    """
+    from src.core.pending_requests import PendingRequestManager
+
+    manager = PendingRequestManager(cleanup_interval=3600)
+    await manager.start()
+    yield manager
+    await manager.stop()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the shared UTC clock with one the test advances by hand.
+
+    Returns ``advance(seconds)``; the clock starts at 2024-01-01.
+    """
+    from src.core import clock as clock_module
+
+    now = [datetime(2024, 1, 1)]
+
+    def advance(seconds: float) -> None:
+        now[0] += timedelta(seconds=seconds)
+
+    monkeypatch.setattr(clock_module, "utcnow", lambda: now[0])
+    return advance
 
 
 @pytest.fixture
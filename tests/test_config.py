@@ -1,6 +1,5 @@
 """Test configuration loading."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -12,10 +11,10 @@ from src.core.models import ProxyRole
 
 
 @pytest.fixture
-def temp_config_dir():
+def temp_config_dir(tmp_path):
     """Create a temporary directory for test configurations."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+    # pytest prunes old tmp_path roots itself, so teardown deletes nothing
+    return tmp_path
 
 
 @pytest.fixture
@@ -1,18 +1,31 @@
 """Test the FastAPI application."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
 
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
-from src.core.models import AgentInfo
-from src.main import app, get_agent_registry, get_config, get_message_router
+from src.core.exceptions import AgentNotFoundError
+from src.core.models import AgentInfo, ProxyConfig, ProxyRole
+
+# Share one event loop (and so one client) across the module
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Built once; tests read but never mutate it
+TEST_AGENT = AgentInfo(
+    id="test-agent",
+    fqdn="test.local:8001",
+    proxy_id="test-proxy",
+    group="test-group"
+)
 
 
 @pytest.fixture
 def mock_config():
     """Mock proxy configuration."""
-    from src.core.models import ProxyConfig, ProxyRole
     return ProxyConfig(
         id="test-proxy",
         role=ProxyRole.COORDINATOR,
@@ -22,115 +35,118 @@ def mock_config():
     )
 
 
+class StubRegistry:
+    """Minimal in-memory stand-in for AgentRegistry with pre-seeded return values."""
+
+    def __init__(self, agents: dict[str, AgentInfo] | None = None) -> None:
+        self.agents = dict(agents or {})
+        self.health: dict[str, str] = {}
+        self.agent_card: dict[str, Any] = {}
+
+    async def get_agent(self, agent_id: str) -> AgentInfo | None:
+        return self.agents.get(agent_id)
+
+    async def get_health_status(self) -> dict[str, str]:
+        return self.health
+
+    async def fetch_agent_card(self, agent_info: AgentInfo) -> dict[str, Any]:
+        return dict(self.agent_card)
+
+    def get_all_agents(self) -> dict[str, AgentInfo]:
+        return self.agents
+
+    def get_agent_count(self) -> int:
+        return len(self.agents)
+
+    def get_groups(self) -> list[str]:
+        return sorted({agent.group for agent in self.agents.values()})
+
+
+class StubRouter:
+    """Minimal stand-in for MessageRouter that answers from a StubRegistry."""
+
+    def __init__(self, registry: StubRegistry) -> None:
+        self.registry = registry
+
+    async def route_request(self, agent_id: str, http_path: str, **kwargs: Any) -> dict[str, Any]:
+        agent_info = await self.registry.get_agent(agent_id)
+        if agent_info is None:
+            raise AgentNotFoundError(agent_id)
+        return await self.registry.fetch_agent_card(agent_info)
+
+
 @pytest.fixture
-def mock_agent_registry():
-    """Mock agent registry."""
-    registry = AsyncMock()
-    registry.get_agent_count.return_value = 2
-    registry.get_groups.return_value = ["test-group"]
-    registry.get_all_agents.return_value = {
-        "test-agent": AgentInfo(
-            id="test-agent",
-            fqdn="test.local:8001",
-            proxy_id="test-proxy",
-            group="test-group"
-        )
-    }
+def mock_agent_registry(monkeypatch):
+    """Stub agent registry seeded with a single agent, served by src.main.get_agent_registry."""
+    registry = StubRegistry({"test-agent": TEST_AGENT})
+    monkeypatch.setattr("src.main.get_agent_registry", AsyncMock(return_value=registry))
     return registry
 
 
-@pytest.fixture
-def client():
-    """Test client for FastAPI app."""
-    return TestClient(app)
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(app):
+    """Async test client for FastAPI app, shared across the module."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
 
 
+@pytest.mark.xdist_group("fastapi_app")
 class TestFastAPIApp:
     """Test cases for the FastAPI application."""
 
-    def test_health_check(self, client, mock_config, mock_agent_registry):
+    async def test_health_check(self, client, mock_config, mock_agent_registry, monkeypatch):
         """Test health check endpoint."""
-        # Override dependencies
-        app.dependency_overrides[get_config] = lambda: mock_config
-        app.dependency_overrides[get_agent_registry] = lambda: mock_agent_registry
-        mock_agent_registry.get_health_status.return_value = {"test-agent": "healthy"}
-
-        try:
-            response = client.get("/health")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "healthy"
-            assert data["role"] == "coordinator"
-            assert data["proxy_id"] == "test-proxy"
-            assert "connections" in data
-        finally:
-            # Clean up overrides
-            app.dependency_overrides.clear()
-
-    def test_proxy_agent_card(self, client, mock_config):
+        # Endpoints call the getters directly rather than through Depends
+        monkeypatch.setattr("src.main.get_config", AsyncMock(return_value=mock_config))
+        mock_agent_registry.health = {"test-agent": "healthy"}
+
+        response = await client.get("/health")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert data["role"] == "coordinator"
+        assert data["proxy_id"] == "test-proxy"
+        assert "connections" in data
+
+    async def test_proxy_agent_card(self, client, mock_config, monkeypatch):
         """Test proxy's own agent card endpoint."""
-        app.dependency_overrides[get_config] = lambda: mock_config
-
-        try:
-            response = client.get("/.well-known/agent.json")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["name"] == "A2A Proxy test-proxy"
-            assert data["role"] == "coordinator"
-            assert data["capabilities"]["streaming"] is True
-        finally:
-            app.dependency_overrides.clear()
-
-    def test_get_agent_card_success(self, client, mock_agent_registry):
+        monkeypatch.setattr("src.main.get_config", AsyncMock(return_value=mock_config))
+
+        response = await client.get("/.well-known/agent.json")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["name"] == "A2A Proxy test-proxy"
+        assert data["role"] == "coordinator"
+        assert data["capabilities"]["streaming"] is True
+
+    async def test_get_agent_card_success(self, client, mock_agent_registry, monkeypatch):
         """Test getting agent card successfully."""
-        # Mock agent exists
-        agent = AgentInfo(
-            id="test-agent",
-            fqdn="test.local:8001",
-            proxy_id="test-proxy",
-            group="test-group"
-        )
-        app.dependency_overrides[get_agent_registry] = lambda: mock_agent_registry
-        mock_agent_registry.get_agent.return_value = agent
-        mock_agent_registry.fetch_agent_card.return_value = {
+        # The stub registry is seeded with test-agent
+        monkeypatch.setattr("src.main.get_message_router", AsyncMock(return_value=StubRouter(mock_agent_registry)))
+        mock_agent_registry.agent_card = {
             "name": "Test Agent",
             "url": "http://test.local:8001",
             "version": "1.0.0"
         }
 
-        try:
-            response = client.get("/agents/test-agent/.well-known/agent.json")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["name"] == "Test Agent"
-            # URL should be rewritten to proxy URL
-            assert data["url"].endswith("/agents/test-agent")
-        finally:
-            app.dependency_overrides.clear()
-
-    def test_get_agent_card_not_found(self, client, mock_agent_registry):
+        response = await client.get("/agents/test-agent/.well-known/agent.json")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["name"] == "Test Agent"
+        # URL should be rewritten to proxy URL
+        assert data["url"].endswith("/agents/test-agent")
+
+    async def test_get_agent_card_not_found(self, client, mock_agent_registry, monkeypatch):
         """Test getting agent card for non-existent agent."""
-        app.dependency_overrides[get_agent_registry] = lambda: mock_agent_registry
-        mock_agent_registry.get_agent.return_value = None
-
-        try:
-            response = client.get("/agents/non-existent/.well-known/agent.json")
-            assert response.status_code == 404
-            data = response.json()
-            assert data["error"]["code"] == -32002
-            assert "non-existent" in data["error"]["message"]
-        finally:
-            app.dependency_overrides.clear()
-
-    def test_send_message_placeholder(self, client, mock_agent_registry):
+        monkeypatch.setattr("src.main.get_message_router", AsyncMock(return_value=StubRouter(mock_agent_registry)))
+
+        response = await client.get("/agents/non-existent/.well-known/agent.json")
+        assert response.status_code == 404
+        # The endpoint turns AgentNotFoundError into an HTTPException
+        assert "non-existent" in response.json()["detail"]
+
+    async def test_send_message_placeholder(self, client, monkeypatch):
         """Test message send endpoint (placeholder implementation)."""
-        agent = AgentInfo(
-            id="test-agent",
-            fqdn="test.local:8001",
-            proxy_id="test-proxy",
-            group="test-group"
-        )
-        
         # Mock the message router dependency
         mock_message_router = AsyncMock()
         mock_message_router.route_message.return_value = {
@@ -138,47 +154,41 @@ class TestFastAPIApp:
             "result": {"status": "accepted"},
             "id": "test-123"
         }
-        
-        app.dependency_overrides[get_agent_registry] = lambda: mock_agent_registry
-        app.dependency_overrides[get_message_router] = lambda: mock_message_router
-        mock_agent_registry.get_agent.return_value = agent
-
-        try:
-            response = client.post(
-                "/agents/test-agent/v1/messages:send",
-                json={"jsonrpc": "2.0", "method": "message/send", "id": "test-123"}
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["jsonrpc"] == "2.0"
-            assert data["result"]["status"] == "accepted"
-        finally:
-            app.dependency_overrides.clear()
-
-    def test_debug_list_agents(self, client, mock_agent_registry):
+        monkeypatch.setattr("src.main.get_message_router", AsyncMock(return_value=mock_message_router))
+
+        response = await client.post(
+            "/agents/test-agent/v1/messages:send",
+            json={"jsonrpc": "2.0", "method": "message/send", "id": "test-123"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["jsonrpc"] == "2.0"
+        assert data["result"]["status"] == "accepted"
+
+    async def test_debug_list_agents(self, client, mock_agent_registry):
         """Test debug endpoint for listing agents."""
-        # Mock the registry methods to return actual data instead of coroutines
-        # For non-async methods, we need to set side_effect to return values directly
-        mock_agent_registry.get_all_agents = lambda: {
-            "test-agent": AgentInfo(
-                id="test-agent",
-                fqdn="test.local:8001",
-                proxy_id="test-proxy",
-                group="test-group"
-            )
-        }
-        mock_agent_registry.get_groups = lambda: ["test-group"]
-        mock_agent_registry.get_agent_count = lambda: 1
-        
-        app.dependency_overrides[get_agent_registry] = lambda: mock_agent_registry
-
-        try:
-            response = client.get("/debug/agents")
-            assert response.status_code == 200
-            data = response.json()
-            assert "agents" in data
-            assert "groups" in data
-            assert "total_count" in data
-        finally:
-            app.dependency_overrides.clear()
+        response = await client.get("/debug/agents")
+        assert response.status_code == 200
+        data = response.json()
+        assert "agents" in data
+        assert "groups" in data
+        assert "total_count" in data
+
+    async def test_concurrent_smoke(self, client, mock_config, mock_agent_registry, monkeypatch):
+        """Test independent read endpoints served concurrently."""
+        mock_agent_registry.health = {"test-agent": "healthy"}
+        monkeypatch.setattr("src.main.get_config", AsyncMock(return_value=mock_config))
+
+        health, card, agents = await asyncio.gather(
+            client.get("/health"),
+            client.get("/.well-known/agent.json"),
+            client.get("/debug/agents"),
+        )
+
+        assert health.status_code == 200
+        assert health.json()["proxy_id"] == "test-proxy"
+        assert card.status_code == 200
+        assert card.json()["role"] == "coordinator"
+        assert agents.status_code == 200
+        assert agents.json()["total_count"] == 1
@@ -1,13 +1,17 @@
 """Tests for Service Bus components."""
 
-from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from dataclasses import replace
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
 from src.core.models import MessageEnvelope
 from src.servicebus.client import AzureServiceBusClient
 from src.servicebus.models import (
+    IServiceBusClient,
+    MessageHandler,
     ServiceBusConfig,
     ServiceBusMessage,
     ServiceBusMessageType,
@@ -17,7 +21,7 @@ from src.servicebus.publisher import MessagePublisher
 from src.servicebus.subscriber import MessageSubscriber
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def servicebus_config():
     """Service Bus configuration fixture."""
     return ServiceBusConfig(
@@ -29,7 +33,7 @@ def servicebus_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def message_envelope():
     """Message envelope fixture."""
     return MessageEnvelope(
@@ -41,7 +45,7 @@ def message_envelope():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def servicebus_message(message_envelope):
     """Service Bus message fixture."""
     return ServiceBusMessage(
@@ -50,66 +54,107 @@ def servicebus_message(message_envelope):
         envelope=message_envelope,
         payload=b"test payload",
         message_type=ServiceBusMessageType.REQUEST,
-        created_at=datetime.utcnow()
+        created_at=datetime(2024, 1, 1, tzinfo=UTC)
     )
 
 
-@pytest.fixture
-def mock_azure_client():
-    """Mock Azure Service Bus client."""
-    return AsyncMock()
+class StubServiceBusClient(IServiceBusClient):
+    """In-memory Service Bus client whose operations always succeed."""
 
+    async def start(self) -> None:
+        pass
 
-@pytest.fixture
+    async def stop(self) -> None:
+        pass
+
+    async def send_message(
+        self,
+        topic_name: str,
+        message: ServiceBusMessage,
+        session_id: str | None = None
+    ) -> bool:
+        return True
+
+    async def send_batch(
+        self,
+        topic_name: str,
+        messages: list[ServiceBusMessage],
+        session_id: str | None = None
+    ) -> int:
+        return len(messages)
+
+    async def create_subscription(
+        self,
+        subscription: ServiceBusSubscription,
+        message_handler: MessageHandler
+    ) -> bool:
+        return True
+
+    async def delete_subscription(self, subscription_name: str, topic_name: str) -> bool:
+        return True
+
+    async def get_subscription_stats(self, subscription_name: str, topic_name: str) -> dict[str, Any]:
+        return {}
+
+
+@pytest.fixture(scope="module")
 def mock_client():
-    """Mock Service Bus client."""
-    client = AsyncMock()
-    client.send_message.return_value = True
-    client.create_subscription.return_value = True
-    client.delete_subscription.return_value = True
-    return client
+    """Stub Service Bus client, shared by the module since it holds no state."""
+    return StubServiceBusClient()
 
 
 class TestServiceBusConfig:
     """Test Service Bus configuration."""
 
-    def test_config_creation(self):
-        """Test Service Bus config creation with defaults."""
-        config = ServiceBusConfig(
-            namespace="test",
-            connection_string="test-connection"
-        )
-
-        assert config.namespace == "test"
-        assert config.connection_string == "test-connection"
-        assert config.request_topic == "a2a-requests"  # default value
-        assert config.response_topic == "a2a-responses"  # default value
-        assert config.notification_topic == "a2a-notifications"  # default value
-        assert config.default_message_ttl == 300
-        assert config.max_retry_count == 3
-        assert config.receive_timeout == 30
-
-    def test_config_with_custom_values(self):
-        """Test Service Bus config with custom values."""
-        config = ServiceBusConfig(
-            namespace="custom",
-            connection_string="custom-connection",
-            request_topic="custom-requests",
-            response_topic="custom-responses",
-            notification_topic="custom-notifications",
-            default_message_ttl=7200,
-            max_retry_count=5,
-            receive_timeout=60
-        )
-
-        assert config.namespace == "custom"
-        assert config.connection_string == "custom-connection"
-        assert config.request_topic == "custom-requests"
-        assert config.response_topic == "custom-responses"
-        assert config.notification_topic == "custom-notifications"
-        assert config.default_message_ttl == 7200
-        assert config.max_retry_count == 5
-        assert config.receive_timeout == 60
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            pytest.param(
+                {"namespace": "test", "connection_string": "test-connection"},
+                {
+                    "namespace": "test",
+                    "connection_string": "test-connection",
+                    "request_topic": "a2a-requests",
+                    "response_topic": "a2a-responses",
+                    "notification_topic": "a2a-notifications",
+                    "default_message_ttl": 300,
+                    "max_retry_count": 3,
+                    "retry_delay_seconds": 5,
+                    "batch_size": 10,
+                    "receive_timeout": 10,
+                },
+                id="defaults",
+            ),
+            pytest.param(
+                {
+                    "namespace": "custom",
+                    "connection_string": "custom-connection",
+                    "request_topic": "custom-requests",
+                    "response_topic": "custom-responses",
+                    "notification_topic": "custom-notifications",
+                    "default_message_ttl": 7200,
+                    "max_retry_count": 5,
+                    "receive_timeout": 60,
+                },
+                {
+                    "namespace": "custom",
+                    "connection_string": "custom-connection",
+                    "request_topic": "custom-requests",
+                    "response_topic": "custom-responses",
+                    "notification_topic": "custom-notifications",
+                    "default_message_ttl": 7200,
+                    "max_retry_count": 5,
+                    "retry_delay_seconds": 5,
+                    "batch_size": 10,
+                    "receive_timeout": 60,
+                },
+                id="custom",
+            ),
+        ],
+    )
+    def test_config(self, kwargs, expected):
+        """Test Service Bus config creation against its full field set."""
+        assert ServiceBusConfig(**kwargs).model_dump() == expected
 
 
 class TestServiceBusMessage:
@@ -128,16 +173,17 @@ class TestServiceBusMessage:
         # Message without expiry should not be expired
         assert not servicebus_message.is_expired()
 
-        # Set past expiry
+        # Set past expiry on a copy; the fixture is shared across the session
         past_time = datetime(2020, 1, 1)
-        servicebus_message.expires_at = past_time
-        assert servicebus_message.is_expired()
+        message = replace(servicebus_message, expires_at=past_time)
+        assert message.is_expired()
 
     def test_add_retry(self, servicebus_message):
         """Test adding retry count."""
-        assert servicebus_message.retry_count == 0
-        servicebus_message.add_retry()
-        assert servicebus_message.retry_count == 1
+        message = replace(servicebus_message)
+        assert message.retry_count == 0
+        message.add_retry()
+        assert message.retry_count == 1
 
 
 class TestServiceBusSubscription:
@@ -148,15 +194,15 @@ class TestServiceBusSubscription:
         subscription = ServiceBusSubscription(
             name="test-sub",
             topic_name="test-topic",
-            filter_expression="toAgent = 'test'"
+            filter_rule="toAgent = 'test'"
         )
 
         assert subscription.name == "test-sub"
         assert subscription.topic_name == "test-topic"
-        assert subscription.filter_expression == "toAgent = 'test'"
-        assert subscription.max_delivery_count == 5  # default
-        assert subscription.auto_delete_on_idle == 3600  # default
-        assert subscription.enable_dead_lettering is True  # default
+        assert subscription.filter_rule == "toAgent = 'test'"
+        assert subscription.max_delivery_count == 10  # default
+        assert subscription.default_message_ttl == 3600  # default
+        assert subscription.dead_lettering_on_message_expiration is True  # default
 
 
 class TestAzureServiceBusClient:
@@ -197,25 +243,11 @@ class TestAzureServiceBusClient:
             mock_instance = AsyncMock()
             mock_sender = AsyncMock()
 
-            # Create a proper async context manager
-            class MockContextManager:
-                def __init__(self, sender):
-                    self.sender = sender
-
-                async def __aenter__(self):
-                    return self.sender
-
-                async def __aexit__(self, exc_type, exc_val, exc_tb):
-                    return False
-
-            # Mock get_topic_sender to return our context manager
-            def mock_get_topic_sender(topic_name):
-                return MockContextManager(mock_sender)
-
-            mock_instance.get_topic_sender = mock_get_topic_sender
-
-            # Mock the send_messages method
+            # The sender doubles as its own async context manager
+            mock_sender.__aenter__.return_value = mock_sender
+            mock_sender.__aexit__.return_value = False
             mock_sender.send_messages = AsyncMock(return_value=None)
+            mock_instance.get_topic_sender = MagicMock(return_value=mock_sender)
 
             mock_sb_client.from_connection_string.return_value = mock_instance
 
@@ -236,33 +268,21 @@ class TestMessagePublisher:
         """Publisher fixture."""
         return MessagePublisher(mock_client, servicebus_config)
 
-    @pytest.mark.asyncio
-    async def test_publish_request(self, publisher, message_envelope):
-        """Test publishing a request."""
-        result = await publisher.publish_request(
-            envelope=message_envelope,
-            payload=b"test payload"
-        )
-
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_publish_response(self, publisher, message_envelope):
-        """Test publishing a response."""
-        result = await publisher.publish_response(
+    @pytest.mark.parametrize(
+        ("method_name", "extra"),
+        [
+            ("publish_request", {}),
+            ("publish_response", {"correlation_id": "test-correlation-id"}),
+            ("publish_notification", {}),
+        ],
+    )
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_publish(self, publisher, message_envelope, method_name, extra):
+        """Test publishing each message type."""
+        result = await getattr(publisher, method_name)(
             envelope=message_envelope,
             payload=b"test payload",
-            correlation_id="test-correlation-id"
-        )
-
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_publish_notification(self, publisher, message_envelope):
-        """Test publishing a notification."""
-        result = await publisher.publish_notification(
-            envelope=message_envelope,
-            payload=b"test payload"
+            **extra
         )
 
         assert result is True
@@ -276,41 +296,39 @@ class TestMessageSubscriber:
         """Subscriber fixture."""
         return MessageSubscriber(mock_client, servicebus_config, "test-proxy")
 
-    @pytest.mark.asyncio
-    async def test_subscribe_to_requests(self, subscriber):
-        """Test subscribing to requests."""
-        handler = AsyncMock()
-        result = await subscriber.subscribe_to_requests("writer", handler)
-
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_subscribe_to_responses(self, subscriber):
-        """Test subscribing to responses."""
-        handler = AsyncMock()
-        result = await subscriber.subscribe_to_responses("test-*", handler)
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_start_subscriptions(self, subscriber):
+        """Test a group subscription registers the group's request and response topics."""
+        result = await subscriber.start_subscriptions([{"group": "writer", "filter": "toAgent = 'writer'"}])
 
-        assert result is True
+        assert result is None
+        active = subscriber.get_active_subscriptions().values()
+        assert {subscription.topic_name for subscription in active} == {
+            "a2a.writer.requests",
+            "a2a.writer.responses",
+        }
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_subscribe_to_notifications(self, subscriber):
-        """Test subscribing to notifications."""
-        handler = AsyncMock()
-        result = await subscriber.subscribe_to_notifications(handler)
+        """Test subscribing to notifications registers the named subscription."""
+        result = await subscriber.subscribe_to_notifications("test-notifications", AsyncMock())
 
         assert result is True
+        subscription = subscriber.get_active_subscriptions()["test-notifications"]
+        assert subscription.topic_name == "a2a.notifications"
 
     @pytest.mark.asyncio
-    async def test_unsubscribe(self, subscriber, mock_client):
+    async def test_unsubscribe(self, subscriber, mock_client, monkeypatch):
         """Test unsubscribing."""
         # Set up active subscription
         subscription = ServiceBusSubscription(
             name="test-subscription",
             topic_name="test-topic",
-            filter_expression="1=1"
+            filter_rule="1=1"
         )
         subscriber._active_subscriptions["test-subscription"] = subscription
-        mock_client.delete_subscription.return_value = True
+        # Spy on the shared stub for this test only so the call can be asserted
+        monkeypatch.setattr(mock_client, "delete_subscription", Mock(wraps=mock_client.delete_subscription))
 
         result = await subscriber.unsubscribe("test-subscription")
 
@@ -323,16 +341,12 @@ class TestMessageSubscriber:
     @pytest.mark.asyncio
     async def test_unsubscribe_all(self, subscriber, mock_client):
         """Test unsubscribing from all subscriptions."""
-        # Set up multiple active subscriptions
-        for i in range(3):
-            subscription = ServiceBusSubscription(
-                name=f"test-subscription-{i}",
-                topic_name="test-topic",
-                filter_expression="1=1"
-            )
-            subscriber._active_subscriptions[f"test-subscription-{i}"] = subscription
-
-        mock_client.delete_subscription.return_value = True
+        # Set up multiple active subscriptions from one template
+        base = ServiceBusSubscription(name="test-subscription", topic_name="test-topic", filter_rule="1=1")
+        subscriber._active_subscriptions = {
+            f"test-subscription-{i}": replace(base, name=f"test-subscription-{i}")
+            for i in range(3)
+        }
 
         result = await subscriber.unsubscribe_all()
 
@@ -343,10 +357,6 @@ class TestMessageSubscriber:
     async def test_response_correlation(self, subscriber, mock_client):
         """Test that responses are properly correlated."""
         # Create a mock response message
-        from src.core.models import MessageEnvelope
-        from src.servicebus.models import ServiceBusMessage, ServiceBusMessageType
-        from datetime import datetime
-
         correlation_id = "test-correlation-123"
 
         envelope = MessageEnvelope(
@@ -366,7 +376,7 @@ class TestMessageSubscriber:
             envelope=envelope,
             payload=b'{"name": "Critic Agent"}',
             message_type=ServiceBusMessageType.RESPONSE,
-            created_at=datetime.utcnow(),
+            created_at=datetime(2024, 1, 1, tzinfo=UTC),
             properties={"toProxy": "proxy-1", "fromProxy": "proxy-follower"}
         )
 
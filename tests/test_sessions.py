@@ -1,8 +1,6 @@
 """Tests for session management."""
 
 import asyncio
-import shutil
-import tempfile
 from datetime import datetime, timedelta
 
 import pytest
@@ -33,6 +31,7 @@ class TestSessionInfo:
 
     def test_session_expiration(self):
         """Test session expiration logic."""
+        now = datetime.utcnow()
         session = SessionInfo(
             session_id="test-session",
             agent_id="test-agent"
@@ -42,11 +41,11 @@ class TestSessionInfo:
         assert not session.is_expired()
 
         # Set expiration in the past
-        session.expires_at = datetime.utcnow() - timedelta(seconds=1)
+        session.expires_at = now - timedelta(seconds=1)
         assert session.is_expired()
 
         # Set expiration in the future
-        session.expires_at = datetime.utcnow() + timedelta(seconds=3600)
+        session.expires_at = now + timedelta(seconds=3600)
         assert not session.is_expired()
 
     def test_extend_ttl(self):
@@ -59,13 +58,14 @@ class TestSessionInfo:
         original_activity = session.last_activity
 
         # Extend TTL
+        now = datetime.utcnow()
         session.extend_ttl(3600)
 
         assert session.expires_at is not None
-        assert session.expires_at > datetime.utcnow()
+        assert session.expires_at >= now + timedelta(seconds=3600)
         assert session.last_activity > original_activity
 
-    def test_touch(self):
+    def test_touch(self, clock):
         """Test updating last activity."""
         session = SessionInfo(
             session_id="test-session",
@@ -74,50 +74,44 @@ class TestSessionInfo:
 
         original_activity = session.last_activity
 
-        # Wait a bit and touch
-        import time
-        time.sleep(0.01)
+        # A single microsecond is enough for touch to register
+        clock(0.000001)
         session.touch()
 
-        assert session.last_activity > original_activity
+        assert session.last_activity - original_activity == timedelta(microseconds=1)
 
 
 class TestSessionConfig:
     """Test SessionConfig model."""
 
-    def test_validate_ttl(self):
-        """Test TTL validation."""
-        config = SessionConfig(
-            default_ttl_seconds=3600,
-            max_ttl_seconds=86400
-        )
-
-        # Valid TTL
-        assert config.validate_ttl(3600) == 3600
+    # Pure, so one instance serves every case
+    CONFIG = SessionConfig(default_ttl_seconds=3600, max_ttl_seconds=86400)
 
-        # Too small
-        assert config.validate_ttl(0) == 1
-        assert config.validate_ttl(-100) == 1
-
-        # Too large
-        assert config.validate_ttl(100000) == 86400
+    @pytest.mark.parametrize(
+        ("ttl_in", "ttl_out"),
+        [
+            pytest.param(3600, 3600, id="valid"),
+            pytest.param(0, 1, id="zero"),
+            pytest.param(-100, 1, id="negative"),
+            pytest.param(100000, 86400, id="too-large"),
+        ],
+    )
+    def test_validate_ttl(self, ttl_in, ttl_out):
+        """Test TTL validation clamps to the configured bounds."""
+        assert self.CONFIG.validate_ttl(ttl_in) == ttl_out
 
 
 class TestFileSessionStore:
     """Test FileSessionStore implementation."""
 
     @pytest.fixture
-    async def temp_store(self):
+    async def temp_store(self, tmp_path):
         """Create a temporary session store."""
-        temp_dir = tempfile.mkdtemp()
-        store = FileSessionStore(temp_dir)
+        store = FileSessionStore(str(tmp_path / "store"))
 
         async with store:
             yield store
 
-        # Cleanup
-        shutil.rmtree(temp_dir, ignore_errors=True)
-
     async def test_create_and_get_session(self, temp_store):
         """Test creating and retrieving a session."""
         session = await temp_store.create_session(
@@ -155,6 +149,50 @@ class TestFileSessionStore:
         assert retrieved is not None
         assert retrieved.metadata["updated"] is True
 
+    async def test_extend_ttl(self, temp_store):
+        """Test extending a session's TTL directly in the store."""
+        session = await temp_store.create_session(agent_id="test-agent", ttl_seconds=60)
+
+        extended = await temp_store.extend_ttl(session.session_id, 3600)
+        assert extended is not None
+        assert extended.expires_at > session.expires_at
+
+        retrieved = await temp_store.get_session(session.session_id)
+        assert retrieved is not None
+        assert retrieved.expires_at == extended.expires_at
+
+        # Unknown sessions cannot be extended
+        assert await temp_store.extend_ttl("non-existent", 3600) is None
+
+    async def test_delete_sessions_batch(self, temp_store):
+        """Test deleting several sessions in one batch."""
+        session1 = await temp_store.create_session(agent_id="agent1")
+        session2 = await temp_store.create_session(agent_id="agent2")
+        session3 = await temp_store.create_session(agent_id="agent3")
+
+        removed_count = await temp_store.delete_sessions_batch(
+            [session1.session_id, session2.session_id, "non-existent"]
+        )
+        assert removed_count == 2
+
+        assert await temp_store.get_session(session1.session_id) is None
+        assert await temp_store.get_session(session2.session_id) is None
+        assert await temp_store.get_session(session3.session_id) is not None
+
+    async def test_concurrent_updates_across_sessions(self, temp_store):
+        """Test concurrent updates to different sessions all persist."""
+        sessions = [await temp_store.create_session(agent_id=f"agent{i}") for i in range(4)]
+        for session in sessions:
+            session.metadata["updated"] = True
+
+        results = await asyncio.gather(*(temp_store.update_session(s) for s in sessions))
+        assert all(results)
+
+        for session in sessions:
+            retrieved = await temp_store.get_session(session.session_id)
+            assert retrieved is not None
+            assert retrieved.metadata["updated"] is True
+
     async def test_delete_session(self, temp_store):
         """Test deleting a session."""
         session = await temp_store.create_session(agent_id="test-agent")
@@ -174,9 +212,11 @@ class TestFileSessionStore:
     async def test_list_sessions(self, temp_store):
         """Test listing sessions."""
         # Create sessions for different agents
-        session1 = await temp_store.create_session(agent_id="agent1")
-        session2 = await temp_store.create_session(agent_id="agent2")
-        session3 = await temp_store.create_session(agent_id="agent1")
+        await asyncio.gather(
+            temp_store.create_session(agent_id="agent1"),
+            temp_store.create_session(agent_id="agent2"),
+            temp_store.create_session(agent_id="agent1")
+        )
 
         # List all sessions
         all_sessions = await temp_store.list_sessions()
@@ -204,14 +244,14 @@ class TestFileSessionStore:
         retrieved = await temp_store.get_session_by_correlation_id("non-existent")
         assert retrieved is None
 
-    async def test_cleanup_expired_sessions(self, temp_store):
+    async def test_cleanup_expired_sessions(self, temp_store, clock):
         """Test cleaning up expired sessions."""
         # Create sessions with different expiration times
         session1 = await temp_store.create_session(agent_id="agent1", ttl_seconds=1)
         session2 = await temp_store.create_session(agent_id="agent2", ttl_seconds=3600)
 
-        # Wait for first session to expire
-        await asyncio.sleep(1.1)
+        # Move past the first session's expiry
+        clock(2)
 
         # Cleanup expired sessions
         removed_count = await temp_store.cleanup_expired_sessions()
@@ -225,15 +265,17 @@ class TestFileSessionStore:
         retrieved = await temp_store.get_session(session2.session_id)
         assert retrieved is not None
 
-    async def test_get_stats(self, temp_store):
+    async def test_get_stats(self, temp_store, clock):
         """Test getting session statistics."""
         # Create sessions
-        await temp_store.create_session(agent_id="agent1", ttl_seconds=3600)
-        await temp_store.create_session(agent_id="agent1", ttl_seconds=3600)
-        await temp_store.create_session(agent_id="agent2", ttl_seconds=1)
+        await asyncio.gather(
+            temp_store.create_session(agent_id="agent1", ttl_seconds=3600),
+            temp_store.create_session(agent_id="agent1", ttl_seconds=3600),
+            temp_store.create_session(agent_id="agent2", ttl_seconds=1)
+        )
 
-        # Wait for one to expire
-        await asyncio.sleep(1.1)
+        # Move past one session's expiry
+        clock(2)
 
         stats = await temp_store.get_stats()
         assert stats.total_sessions == 3
@@ -247,15 +289,14 @@ class TestSessionManager:
     """Test SessionManager implementation."""
 
     @pytest.fixture
-    async def temp_manager(self):
+    async def temp_manager(self, tmp_path):
         """Create a temporary session manager."""
-        temp_dir = tempfile.mkdtemp()
         config = SessionConfig(
             default_ttl_seconds=3600,
             max_ttl_seconds=86400,
-            cleanup_interval_seconds=1,  # Fast cleanup for testing
+            cleanup_interval_seconds=3600,  # Tests drive cleanup passes directly
             max_sessions_per_agent=5,
-            session_store_path=temp_dir
+            session_store_path=str(tmp_path / "store")
         )
 
         manager = SessionManager(config)
@@ -263,39 +304,108 @@ class TestSessionManager:
         async with manager:
             yield manager
 
-        # Cleanup
-        shutil.rmtree(temp_dir, ignore_errors=True)
-
     async def test_create_session_with_defaults(self, temp_manager):
         """Test creating a session with default configuration."""
+        now = datetime.utcnow()
         session = await temp_manager.create_session(agent_id="test-agent")
 
         assert session.agent_id == "test-agent"
         assert session.expires_at is not None
-        assert session.expires_at > datetime.utcnow()
+        assert session.expires_at >= now + timedelta(seconds=temp_manager.config.default_ttl_seconds)
 
     async def test_session_limit_enforcement(self, temp_manager):
         """Test session limit enforcement."""
         # Create sessions up to the limit
-        for i in range(5):
-            await temp_manager.create_session(agent_id="test-agent")
+        await asyncio.gather(*(temp_manager.create_session(agent_id="test-agent") for _ in range(5)))
 
         # Next session should fail
         with pytest.raises(ValueError, match="reached maximum session limit"):
             await temp_manager.create_session(agent_id="test-agent")
 
-    async def test_get_session_with_touch(self, temp_manager):
+    async def test_get_session_with_touch(self, temp_manager, clock):
         """Test getting a session with activity update."""
         session = await temp_manager.create_session(agent_id="test-agent")
         original_activity = session.last_activity
 
-        # Wait a bit and get session with touch
-        await asyncio.sleep(0.01)
+        # Move time on a bit and get session with touch
+        clock(1)
         retrieved = await temp_manager.get_session(session.session_id, touch=True)
 
         assert retrieved is not None
         assert retrieved.last_activity > original_activity
 
+    async def test_touch_persistence_is_debounced(self, temp_manager, clock):
+        """Test touches within the debounce window are not written to the store."""
+        session = await temp_manager.create_session(agent_id="test-agent")
+
+        clock(1)
+        retrieved = await temp_manager.get_session(session.session_id, touch=True)
+        assert retrieved is not None
+        assert retrieved.last_activity > session.last_activity
+
+        stored = await temp_manager.session_store.get_session(session.session_id)
+        assert stored is not None
+        assert stored.last_activity == session.last_activity
+
+    async def test_touch_is_flushed_in_background(self, temp_manager):
+        """Test touches outside the debounce window are persisted by the flusher."""
+        temp_manager.config.touch_debounce_seconds = 0
+        session = await temp_manager.create_session(agent_id="test-agent")
+
+        retrieved = await temp_manager.get_session(session.session_id, touch=True)
+        assert retrieved is not None
+        await temp_manager._flush_task
+
+        stored = await temp_manager.session_store.get_session(session.session_id)
+        assert stored is not None
+        assert stored.last_activity == retrieved.last_activity
+
+    async def test_touch_flush_keeps_concurrent_extend(self, temp_manager, clock):
+        """Test a queued touch flushed after an extend does not roll the TTL back."""
+        temp_manager.config.touch_debounce_seconds = 0
+        session = await temp_manager.create_session(agent_id="test-agent", ttl_seconds=60)
+
+        clock(1)
+        retrieved = await temp_manager.get_session(session.session_id, touch=True)
+        assert retrieved is not None
+
+        # Another writer extends the session before the queued touch is flushed
+        clock(1)
+        extended = await temp_manager.session_store.extend_ttl(session.session_id, 3600)
+        assert extended is not None
+        await temp_manager._flush_task
+
+        stored = await temp_manager.session_store.get_session(session.session_id)
+        assert stored is not None
+        assert stored.expires_at == extended.expires_at
+        assert stored.last_activity == extended.last_activity
+
+    async def test_update_does_not_wait_for_flush(self, temp_manager, monkeypatch):
+        """Test a direct write goes through while a background flush is stalled."""
+        temp_manager.config.touch_debounce_seconds = 0
+        session = await temp_manager.create_session(agent_id="test-agent")
+
+        store = temp_manager.session_store
+        touch = store.touch
+        release = asyncio.Event()
+
+        async def stalled_touch(session_id, last_activity):
+            await release.wait()
+            return await touch(session_id, last_activity)
+
+        monkeypatch.setattr(store, "touch", stalled_touch)
+
+        retrieved = await temp_manager.get_session(session.session_id, touch=True)
+        assert retrieved is not None
+        retrieved.metadata["step"] = "updated"
+        assert await asyncio.wait_for(temp_manager.update_session(retrieved), timeout=1)
+
+        release.set()
+        await temp_manager._flush_task
+        stored = await store.get_session(session.session_id)
+        assert stored is not None
+        assert stored.metadata == {"step": "updated"}
+
     async def test_extend_session(self, temp_manager):
         """Test extending a session's TTL."""
         session = await temp_manager.create_session(agent_id="test-agent", ttl_seconds=60)
@@ -310,14 +420,107 @@ class TestSessionManager:
         assert retrieved is not None
         assert retrieved.expires_at > original_expires
 
-    async def test_automatic_cleanup(self, temp_manager):
+    async def test_automatic_cleanup(self, temp_manager, clock):
         """Test automatic cleanup of expired sessions."""
         # Create a session with short TTL
         session = await temp_manager.create_session(agent_id="test-agent", ttl_seconds=1)
 
-        # Wait for expiration and cleanup
-        await asyncio.sleep(2)
+        # Move past expiry and run one pass of the background cleanup
+        clock(2)
+        removed_count = await temp_manager._cleanup_due_sessions()
 
-        # Session should be gone
-        retrieved = await temp_manager.get_session(session.session_id)
-        assert retrieved is None
+        # Session should be gone from the store, not just hidden on read
+        assert removed_count == 1
+        assert await temp_manager.session_store.get_session(session.session_id) is None
+
+    async def test_cleanup_due_sessions_skips_stale_entries(self, temp_manager):
+        """Test heap-driven cleanup removes due sessions and ignores stale deadlines."""
+        expired = await temp_manager.create_session(agent_id="test-agent")
+        extended = await temp_manager.create_session(agent_id="test-agent")
+
+        # Move one session's deadline into the past
+        past = datetime.utcnow() - timedelta(seconds=1)
+        expired.expires_at = past
+        assert await temp_manager.update_session(expired)
+
+        # A stale heap entry for a session whose deadline has since moved on
+        temp_manager._track_expiry(extended.model_copy(update={"expires_at": past}))
+
+        removed_count = await temp_manager._cleanup_due_sessions()
+
+        assert removed_count == 1
+        assert await temp_manager.session_store.get_session(expired.session_id) is None
+        assert await temp_manager.session_store.get_session(extended.session_id) is not None
+
+    async def test_cleanup_due_sessions_retries_failed_checks(self, temp_manager, clock, monkeypatch):
+        """Test a failed expiry check is re-queued with backoff rather than dropped."""
+        session = await temp_manager.create_session(agent_id="test-agent", ttl_seconds=1)
+
+        store = temp_manager.session_store
+        get_session = store.get_session
+        failures = [OSError("disk busy")] * 2
+
+        async def flaky_get_session(session_id):
+            if failures:
+                raise failures.pop()
+            return await get_session(session_id)
+
+        monkeypatch.setattr(store, "get_session", flaky_get_session)
+
+        clock(2)
+        assert await temp_manager._cleanup_due_sessions() == 0
+        assert temp_manager._next_cleanup_delay() == 1.0
+
+        # The second failure doubles the backoff
+        clock(1)
+        assert await temp_manager._cleanup_due_sessions() == 0
+        assert temp_manager._next_cleanup_delay() == 2.0
+
+        clock(2)
+        assert await temp_manager._cleanup_due_sessions() == 1
+        assert await get_session(session.session_id) is None
+        assert temp_manager._cleanup_failures == {}
+
+    async def test_manual_cleanup_prunes_bookkeeping(self, temp_manager, clock):
+        """Test manual cleanup forgets the debounce timestamps of removed sessions."""
+        session = await temp_manager.create_session(agent_id="test-agent", ttl_seconds=1)
+        assert session.session_id in temp_manager._last_flush_ts
+
+        clock(2)
+        assert await temp_manager.cleanup_expired_sessions() == 1
+        assert await temp_manager.session_store.get_session(session.session_id) is None
+        assert temp_manager._last_flush_ts == {}
+        assert temp_manager._cleanup_failures == {}
+
+    async def test_cleanup_checks_are_bounded(self, tmp_path, clock, monkeypatch):
+        """Test expiry checks in one cleanup pass never exceed cleanup_concurrency."""
+        config = SessionConfig(
+            cleanup_interval_seconds=3600,
+            cleanup_concurrency=2,
+            session_store_path=str(tmp_path / "store")
+        )
+
+        async with SessionManager(config) as manager:
+            for _ in range(6):
+                await manager.create_session(agent_id="test-agent", ttl_seconds=1)
+
+            store = manager.session_store
+            get_session = store.get_session
+            in_flight = 0
+            max_in_flight = 0
+
+            async def slow_get_session(session_id):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                try:
+                    await asyncio.sleep(0.01)
+                    return await get_session(session_id)
+                finally:
+                    in_flight -= 1
+
+            monkeypatch.setattr(store, "get_session", slow_get_session)
+
+            clock(2)
+            assert await manager._cleanup_due_sessions() == 6
+            assert max_in_flight == 2
@@ -1,25 +1,34 @@
 """Integration tests for topic management functionality."""
 
 import pytest
-from unittest.mock import patch, AsyncMock
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from unittest.mock import patch, AsyncMock, MagicMock, create_autospec
+from httpx import ASGITransport, AsyncClient
 
-from src.main import app
-from src.config.models import TopicGroupConfig
-from src.core.models import ProxyRole
+from src.config.models import ServiceBusConfig, TopicGroupConfig
+from src.core.exceptions import A2AProxyError
+from src.core.models import ProxyConfig, ProxyRole
+from src.servicebus.topic_manager import (
+    TopicHealthResult,
+    TopicHealthStatus,
+    TopicManager,
+    TopicOperationResult,
+    TopicSetResult,
+    TopicStatus,
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def coordinator_config():
-    """Mock coordinator proxy configuration."""
-    return {
-        "id": "proxy-coordinator",
-        "role": ProxyRole.COORDINATOR,
-        "servicebus": {
-            "namespace": "test-namespace",
-            "connection_string": "Endpoint=sb://test.servicebus.windows.net/;SharedAccessKeyName=test;SharedAccessKey=test"
-        },
-        "agent_groups": [
+    """Coordinator proxy configuration; read-only, so built once."""
+    return ProxyConfig(
+        id="proxy-coordinator",
+        role=ProxyRole.COORDINATOR,
+        servicebus=ServiceBusConfig(
+            namespace="test-namespace",
+            connection_string="Endpoint=sb://test.servicebus.windows.net/;SharedAccessKeyName=test;SharedAccessKey=test"
+        ),
+        agent_groups=[
             TopicGroupConfig(
                 name="blog-agents",
                 description="Blog writing agents",
@@ -33,179 +42,175 @@ def coordinator_config():
                 message_ttl_seconds=7200
             )
         ]
-    }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def follower_config():
-    """Mock follower proxy configuration."""
-    return {
-        "id": "proxy-follower",
-        "role": ProxyRole.FOLLOWER,
-        "servicebus": {
-            "namespace": "test-namespace",
-            "connection_string": "Endpoint=sb://test.servicebus.windows.net/;SharedAccessKeyName=test;SharedAccessKey=test"
-        },
-        "agent_groups": []
-    }
+    """Follower proxy configuration; read-only, so built once."""
+    return ProxyConfig(
+        id="proxy-follower",
+        role=ProxyRole.FOLLOWER,
+        servicebus=ServiceBusConfig(
+            namespace="test-namespace",
+            connection_string="Endpoint=sb://test.servicebus.windows.net/;SharedAccessKeyName=test;SharedAccessKey=test"
+        ),
+        agent_groups=[]
+    )
 
 
+def _make_topic_manager_mock(**return_values):
+    """Build a TopicManager mock usable as an async context manager.
+
+    The mock is specced on TopicManager, so misspelled methods fail loudly.
+    Each keyword names a manager method and the value its awaited call returns.
+    """
+    manager = create_autospec(TopicManager, instance=True, spec_set=True)
+    manager.__aenter__.return_value = manager
+    manager.__aexit__.return_value = None
+    for method_name, value in return_values.items():
+        getattr(manager, method_name).return_value = value
+    return manager
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(app):
+    """One async test client shared by the endpoint tests."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+@pytest.mark.asyncio(loop_scope="module")
 class TestTopicManagementEndpoints:
     """Integration tests for topic management endpoints."""
 
-    def test_list_topics_coordinator_access(self, coordinator_config):
-        """Test that coordinator can access topic listing endpoint."""
-        with patch('src.main.get_config', return_value=coordinator_config):
-            with patch('src.servicebus.topic_manager.TopicManager') as mock_manager_class:
-                mock_manager = AsyncMock()
-                mock_manager.__aenter__ = AsyncMock(return_value=mock_manager)
-                mock_manager.__aexit__ = AsyncMock(return_value=None)
-                mock_manager.list_managed_topics.return_value = [
-                    "a2a.blog-agents.requests",
-                    "a2a.blog-agents.responses",
-                    "a2a.research-agents.requests"
-                ]
-                mock_manager_class.return_value = mock_manager
-                
-                client = TestClient(app)
-                response = client.get("/admin/topics")
-                
-                assert response.status_code == 200
-                data = response.json()
-                assert "topics" in data
-                assert len(data["topics"]) == 3
-                assert "total" in data
-                assert data["total"] == 3
-
-    def test_list_topics_follower_denied(self, follower_config):
-        """Test that follower is denied access to topic management."""
-        with patch('src.main.get_config', return_value=follower_config):
-            client = TestClient(app)
-            response = client.get("/admin/topics")
-            
-            assert response.status_code == 403
-            assert "coordinator" in response.json()["detail"].lower()
+    @pytest.mark.parametrize(
+        ("config_fixture", "expected_status"),
+        [("coordinator_config", 200), ("follower_config", 403)],
+    )
+    async def test_list_topics_access(self, client, request, monkeypatch, config_fixture, expected_status):
+        """Test that only the coordinator can access the topic listing endpoint."""
+        monkeypatch.setattr('src.main.get_config', AsyncMock(return_value=request.getfixturevalue(config_fixture)))
+        mock_manager = _make_topic_manager_mock(list_managed_topics=[
+            "a2a.blog-agents.requests",
+            "a2a.blog-agents.responses",
+            "a2a.research-agents.requests"
+        ])
+        monkeypatch.setattr('src.servicebus.topic_manager.TopicManager', MagicMock(return_value=mock_manager))
+
+        response = await client.get("/admin/topics")
+
+        assert response.status_code == expected_status
+        data = response.json()
+        if expected_status == 403:
+            assert "coordinator" in data["detail"].lower()
+            return
 
-    def test_validate_topic_health_success(self, coordinator_config):
+        assert "topics" in data
+        assert len(data["topics"]) == 3
+        assert "total" in data
+        assert data["total"] == 3
+
+    async def test_validate_topic_health_success(self, client, coordinator_config, monkeypatch):
         """Test successful topic health validation."""
-        with patch('src.main.get_config', return_value=coordinator_config):
-            with patch('src.servicebus.topic_manager.TopicManager') as mock_manager_class:
-                from src.servicebus.topic_manager import TopicHealthResult, TopicHealthStatus
-                
-                mock_manager = AsyncMock()
-                mock_manager.__aenter__ = AsyncMock(return_value=mock_manager)
-                mock_manager.__aexit__ = AsyncMock(return_value=None)
-                mock_manager.validate_topic_health.return_value = TopicHealthResult(
-                    group_name="blog-agents",
-                    status=TopicHealthStatus.HEALTHY,
-                    topics={
-                        "a2a.blog-agents.requests": True,
-                        "a2a.blog-agents.responses": True,
-                        "a2a.blog-agents.deadletter": True
-                    },
-                    errors=[]
-                )
-                mock_manager_class.return_value = mock_manager
-                
-                client = TestClient(app)
-                response = client.post("/admin/topics/blog-agents/validate")
-                
-                assert response.status_code == 200
-                data = response.json()
-                assert data["group_name"] == "blog-agents"
-                assert data["status"] == "healthy"
-                assert len(data["topics"]) == 3
-                assert all(data["topics"].values())
-
-    def test_recreate_topic_set_success(self, coordinator_config):
+        monkeypatch.setattr('src.main.get_config', AsyncMock(return_value=coordinator_config))
+        mock_manager = _make_topic_manager_mock(validate_topic_health=TopicHealthResult(
+            group_name="blog-agents",
+            status=TopicHealthStatus.HEALTHY,
+            topics={
+                "a2a.blog-agents.requests": True,
+                "a2a.blog-agents.responses": True,
+                "a2a.blog-agents.deadletter": True
+            },
+            errors=[]
+        ))
+        monkeypatch.setattr('src.servicebus.topic_manager.TopicManager', MagicMock(return_value=mock_manager))
+
+        response = await client.post("/admin/topics/blog-agents/validate")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["group_name"] == "blog-agents"
+        assert data["status"] == "healthy"
+        assert len(data["topics"]) == 3
+        assert all(data["topics"].values())
+
+    async def test_recreate_topic_set_success(self, client, coordinator_config, monkeypatch):
         """Test successful topic set recreation."""
-        with patch('src.main.get_config', return_value=coordinator_config):
-            with patch('src.servicebus.topic_manager.TopicManager') as mock_manager_class:
-                from src.servicebus.topic_manager import (
-                    TopicSetResult, TopicOperationResult, TopicStatus
-                )
-                
-                mock_manager = AsyncMock()
-                mock_manager.__aenter__ = AsyncMock(return_value=mock_manager)
-                mock_manager.__aexit__ = AsyncMock(return_value=None)
-                
-                # Mock deletion results
-                mock_manager.delete_topic_set.return_value = {
-                    "a2a.blog-agents.requests": True,
-                    "a2a.blog-agents.responses": True,
-                    "a2a.blog-agents.deadletter": True
-                }
-                
-                # Mock creation results
-                mock_manager.create_topic_set.return_value = TopicSetResult(
-                    group_name="blog-agents",
-                    request_topic=TopicOperationResult(
-                        topic_name="a2a.blog-agents.requests",
-                        status=TopicStatus.CREATED,
-                        message="Topic created successfully"
-                    ),
-                    response_topic=TopicOperationResult(
-                        topic_name="a2a.blog-agents.responses",
-                        status=TopicStatus.CREATED,
-                        message="Topic created successfully"
-                    ),
-                    deadletter_topic=TopicOperationResult(
-                        topic_name="a2a.blog-agents.deadletter",
-                        status=TopicStatus.CREATED,
-                        message="Topic created successfully"
-                    )
+        monkeypatch.setattr('src.main.get_config', AsyncMock(return_value=coordinator_config))
+        mock_manager = _make_topic_manager_mock(
+            delete_topic_set={
+                "a2a.blog-agents.requests": True,
+                "a2a.blog-agents.responses": True,
+                "a2a.blog-agents.deadletter": True
+            },
+            create_topic_set=TopicSetResult(
+                group_name="blog-agents",
+                request_topic=TopicOperationResult(
+                    topic_name="a2a.blog-agents.requests",
+                    status=TopicStatus.CREATED,
+                    message="Topic created successfully"
+                ),
+                response_topic=TopicOperationResult(
+                    topic_name="a2a.blog-agents.responses",
+                    status=TopicStatus.CREATED,
+                    message="Topic created successfully"
+                ),
+                deadletter_topic=TopicOperationResult(
+                    topic_name="a2a.blog-agents.deadletter",
+                    status=TopicStatus.CREATED,
+                    message="Topic created successfully"
                 )
-                
-                mock_manager_class.return_value = mock_manager
-                
-                client = TestClient(app)
-                response = client.put("/admin/topics/blog-agents/recreate")
-                
-                assert response.status_code == 200
-                data = response.json()
-                assert data["group_name"] == "blog-agents"
-                assert data["create_result"]["is_successful"] is True
-                assert all(data["delete_results"].values())
-
-    def test_recreate_topic_set_group_not_found(self, coordinator_config):
+            )
+        )
+        monkeypatch.setattr('src.servicebus.topic_manager.TopicManager', MagicMock(return_value=mock_manager))
+
+        response = await client.put("/admin/topics/blog-agents/recreate")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["group_name"] == "blog-agents"
+        assert data["create_result"]["is_successful"] is True
+        assert all(data["delete_results"].values())
+
+    async def test_recreate_topic_set_group_not_found(self, client, coordinator_config, monkeypatch):
         """Test recreation fails when group is not found in config."""
-        with patch('src.main.get_config', return_value=coordinator_config):
-            client = TestClient(app)
-            response = client.put("/admin/topics/nonexistent-group/recreate")
-            
-            assert response.status_code == 404
-            assert "not found in configuration" in response.json()["detail"]
-
-    def test_list_configured_groups(self, coordinator_config):
-        """Test listing configured agent groups."""
-        with patch('src.main.get_config', return_value=coordinator_config):
-            client = TestClient(app)
-            response = client.get("/admin/topics/groups")
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert "groups" in data
-            assert len(data["groups"]) == 2
-            
-            # Check group details
-            group_names = [group["name"] for group in data["groups"]]
-            assert "blog-agents" in group_names
-            assert "research-agents" in group_names
-            
-            # Check group properties
-            blog_group = next(g for g in data["groups"] if g["name"] == "blog-agents")
-            assert blog_group["description"] == "Blog writing agents"
-            assert blog_group["max_message_size_mb"] == 1
-            assert blog_group["message_ttl_seconds"] == 3600
-
-    def test_list_configured_groups_follower_denied(self, follower_config):
-        """Test that follower is denied access to group listing."""
-        with patch('src.main.get_config', return_value=follower_config):
-            client = TestClient(app)
-            response = client.get("/admin/topics/groups")
-            
-            assert response.status_code == 403
-            assert "coordinator" in response.json()["detail"].lower()
+        monkeypatch.setattr('src.main.get_config', AsyncMock(return_value=coordinator_config))
+
+        response = await client.put("/admin/topics/nonexistent-group/recreate")
+
+        assert response.status_code == 404
+        assert "not found in configuration" in response.json()["detail"]
+
+    @pytest.mark.parametrize(
+        ("config_fixture", "expected_status"),
+        [("coordinator_config", 200), ("follower_config", 403)],
+    )
+    async def test_list_configured_groups_access(self, client, request, monkeypatch, config_fixture, expected_status):
+        """Test that only the coordinator can list configured agent groups."""
+        monkeypatch.setattr('src.main.get_config', AsyncMock(return_value=request.getfixturevalue(config_fixture)))
+
+        response = await client.get("/admin/topics/groups")
+
+        assert response.status_code == expected_status
+        data = response.json()
+        if expected_status == 403:
+            assert "coordinator" in data["detail"].lower()
+            return
+
+        assert "groups" in data
+        assert len(data["groups"]) == 2
+
+        # Check group details
+        group_names = [group["name"] for group in data["groups"]]
+        assert "blog-agents" in group_names
+        assert "research-agents" in group_names
+
+        # Check group properties
+        blog_group = next(g for g in data["groups"] if g["name"] == "blog-agents")
+        assert blog_group["description"] == "Blog writing agents"
+        assert blog_group["max_message_size_mb"] == 1
+        assert blog_group["message_ttl_seconds"] == 3600
 
 
 class TestTopicManagerStartup:
@@ -225,17 +230,12 @@ class TestTopicManagerStartup:
             
             # Mock configuration loading
             mock_loader = AsyncMock()
-            mock_loader.load_proxy_config.return_value = type('Config', (), coordinator_config)()
+            mock_loader.load_proxy_config.return_value = coordinator_config
             mock_loader.load_agent_registry.return_value = {}
             mock_loader_class.return_value = mock_loader
             
             # Mock topic manager
-            from src.servicebus.topic_manager import TopicSetResult, TopicOperationResult, TopicStatus
-            
-            mock_manager = AsyncMock()
-            mock_manager.__aenter__ = AsyncMock(return_value=mock_manager)
-            mock_manager.__aexit__ = AsyncMock(return_value=None)
-            mock_manager.ensure_topics_exist.return_value = {
+            mock_manager = _make_topic_manager_mock(ensure_topics_exist={
                 "blog-agents": TopicSetResult(
                     group_name="blog-agents",
                     request_topic=TopicOperationResult(
@@ -251,12 +251,12 @@ class TestTopicManagerStartup:
                         status=TopicStatus.CREATED
                     )
                 )
-            }
+            })
             mock_manager_class.return_value = mock_manager
             
             # Mock other components
             mock_registry = AsyncMock()
-            mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
+            mock_registry.__aenter__.return_value = mock_registry
             mock_registry.get_agent_count.return_value = 0
             mock_registry_class.return_value = mock_registry
             
@@ -273,10 +273,10 @@ class TestTopicManagerStartup:
             mock_manager.ensure_topics_exist.assert_not_called()  # Not called yet
             
             # Simulate the startup call
-            await mock_manager.ensure_topics_exist(coordinator_config["agent_groups"])
+            await mock_manager.ensure_topics_exist(coordinator_config.agent_groups)
             
             # Verify topic management was called
-            mock_manager.ensure_topics_exist.assert_called_once_with(coordinator_config["agent_groups"])
+            mock_manager.ensure_topics_exist.assert_called_once_with(coordinator_config.agent_groups)
 
     @pytest.mark.asyncio
     async def test_follower_startup_skips_topic_management(self, follower_config):
@@ -287,27 +287,67 @@ class TestTopicManagerStartup:
             mock_manager_class.return_value = mock_manager
             
             # Simulate follower startup - should not create topic manager
-            if follower_config["role"] == ProxyRole.COORDINATOR and follower_config["agent_groups"]:
-                await mock_manager.ensure_topics_exist(follower_config["agent_groups"])
+            if follower_config.role == ProxyRole.COORDINATOR and follower_config.agent_groups:
+                await mock_manager.ensure_topics_exist(follower_config.agent_groups)
             
             # Verify topic management was not called for follower
             mock_manager.ensure_topics_exist.assert_not_called()
 
-    def test_topic_management_error_handling(self, coordinator_config):
-        """Test error handling during topic management startup."""
-        with patch('src.servicebus.topic_manager.TopicManager') as mock_manager_class:
-            
-            mock_manager = AsyncMock()
-            mock_manager.__aenter__ = AsyncMock(side_effect=Exception("Connection failed"))
-            mock_manager_class.return_value = mock_manager
-            
-            # Simulate startup error - should not crash the application
-            try:
-                async with mock_manager:
-                    await mock_manager.ensure_topics_exist(coordinator_config["agent_groups"])
-            except Exception:
-                # Error should be caught and logged, not crash the app
-                pass
-            
-            # Application should continue even if topic management fails
-            assert True  # Test passes if we reach here without unhandled exception
+    @pytest.mark.asyncio
+    async def test_topic_management_error_handling(self, app, coordinator_config, monkeypatch):
+        """Test the proxy still starts and serves requests when topic setup fails."""
+        # Lifespan assigns these globals; they start unset, and monkeypatch restores them afterwards
+        for name in (
+            "config", "agent_registry", "session_manager", "servicebus_client", "message_publisher",
+            "message_subscriber", "message_router", "pending_request_manager", "admin_transport",
+        ):
+            monkeypatch.setattr(f"src.main.{name}", None)
+
+        loader = MagicMock()
+        loader.load_proxy_config.return_value = coordinator_config
+        loader.extract_agent_registry_from_config.return_value = {}
+        monkeypatch.setattr("src.main.ConfigLoader", MagicMock(return_value=loader))
+
+        registry = MagicMock()
+        registry.get_health_status = AsyncMock(return_value={})
+        monkeypatch.setattr("src.main.AgentRegistry", MagicMock(return_value=registry))
+        monkeypatch.setattr("src.main.SessionManager", MagicMock(return_value=AsyncMock()))
+        monkeypatch.setattr("src.main.AzureServiceBusClient", MagicMock(return_value=AsyncMock()))
+        monkeypatch.setattr("src.main.MessageSubscriber", MagicMock(return_value=AsyncMock()))
+        router_class = MagicMock(return_value=AsyncMock())
+        monkeypatch.setattr("src.main.MessageRouter", router_class)
+
+        transport = MagicMock()
+        close_transport = MagicMock()
+        monkeypatch.setattr("src.main.create_shared_transport", MagicMock(return_value=transport))
+        monkeypatch.setattr("src.main.close_shared_transport", close_transport)
+
+        mock_manager = _make_topic_manager_mock()
+        mock_manager.__aenter__.side_effect = A2AProxyError("Topic manager connection failed")
+        manager_class = MagicMock(return_value=mock_manager)
+        monkeypatch.setattr('src.servicebus.topic_manager.TopicManager', manager_class)
+
+        subscription_manager = AsyncMock()
+        subscription_manager.__aenter__.return_value = subscription_manager
+        subscription_manager.ensure_proxy_subscriptions.return_value = {}
+        monkeypatch.setattr(
+            'src.servicebus.subscription_manager.SubscriptionManager',
+            MagicMock(return_value=subscription_manager)
+        )
+
+        async with app.router.lifespan_context(app):
+            # Startup carried on past the failed topic setup
+            assert manager_class.call_args.kwargs["transport"] is transport
+            mock_manager.__aenter__.assert_awaited_once()
+            mock_manager.ensure_topics_exist.assert_not_called()
+            subscription_manager.ensure_proxy_subscriptions.assert_awaited_once_with(coordinator_config)
+            router_class.assert_called_once()
+
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+                response = await c.get("/health")
+
+        # Shutdown closes the shared admin transport
+        close_transport.assert_called_once_with(transport)
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
+        assert response.json()["proxy_id"] == "proxy-coordinator"